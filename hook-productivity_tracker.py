@@ -10,6 +10,7 @@ hiddenimports.extend([
     'sqlite3',
     'win32gui',
     'win32con',
+    'winsdk',
     'win10toast',
     'gspread',
     'oauth2client',
@@ -153,6 +153,11 @@ if __name__ == "__main__":
         import platform
 
         if platform.system() == "Windows":
+            # Windows only shows native toasts for a registered app ID
+            from src.utils.notification_utils import register_app_id
+            if register_app_id():
+                direct_log("Registered app ID for Windows notifications")
+
             try:
                 import win32gui
                 import win32con
@@ -185,7 +185,9 @@ class UIService:
         Stop the current task and save to database.
 
         Returns:
-            bool: True if stopped and saved successfully
+            tuple: (success, unsynced_count) where success is True if stopped and
+            saved successfully, and unsynced_count is the number of unsynced tasks
+            after saving (None if nothing was saved)
         """
         task_name = self.get_current_task_name()
         self.logger.info(f"Stopping current task")
@@ -224,17 +226,17 @@ class UIService:
 
                 if task_id:
                     self.logger.info(f"Task saved to database with ID: {task_id}")
-                    return True
+                    return True, self.get_unsynced_tasks_count()
                 else:
                     self.logger.error("Failed to save task to database - no ID returned")
-                    return False
+                    return False, None
 
             except Exception as e:
                 self.logger.error(f"Error saving task to database: {e}")
-                return False
+                return False, None
         else:
             self.logger.warning(f"No elapsed time for task '{task_name}' or no task was running")
-            return False
+            return False, None
 
     def sync_to_sheets(self):
         """
@@ -91,6 +91,14 @@ class FloatingPillWidget(QtWidgets.QWidget):
         self.animation = QtCore.QPropertyAnimation(self, b"geometry")
         self.animation.setDuration(200)  # 200ms animation
 
+        # Create a timer to hide when mouse is not over, before anything can restart it
+        self.hide_timer = QtCore.QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self.check_mouse_for_autohide)
+
+        # Auto-hide after 3 seconds of inactivity
+        self.auto_hide_delay = 3000  # 3 seconds
+
         # Setup UI components
         self.setup_ui()
 
@@ -105,14 +113,6 @@ class FloatingPillWidget(QtWidgets.QWidget):
         # Update initial state
         self.update_display()
 
-        # Create a timer to hide when mouse is not over
-        self.hide_timer = QtCore.QTimer(self)
-        self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self.check_mouse_for_autohide)
-
-        # Auto-hide after 3 seconds of inactivity
-        self.auto_hide_delay = 3000  # 3 seconds
-
         self.logger.debug("Dockable pill widget initialized")
 
     def setup_ui(self):
@@ -121,6 +121,11 @@ class FloatingPillWidget(QtWidgets.QWidget):
         """
         self.logger.debug("Setting up dockable pill UI")
 
+        # The style is shared by the whole application, look it up once
+        self._style = QtWidgets.QApplication.instance().style()
+        self._icon_play = self._style.standardIcon(QtWidgets.QStyle.SP_MediaPlay)
+        self._icon_pause = self._style.standardIcon(QtWidgets.QStyle.SP_MediaPause)
+
         # Main layout
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(10, 5, 10, 5)
@@ -151,7 +156,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
         # Start button
         self.start_button = QtWidgets.QPushButton()
-        self.start_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
+        self.start_button.setIcon(self._icon_play)
         self.start_button.setMaximumWidth(24)
         self.start_button.setMaximumHeight(24)
         self.start_button.setToolTip("Start New Task")
@@ -160,7 +165,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
         # Pause/Resume button
         self.pause_resume_button = QtWidgets.QPushButton()
-        self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause))
+        self.pause_resume_button.setIcon(self._icon_pause)
         self.pause_resume_button.setMaximumWidth(24)
         self.pause_resume_button.setMaximumHeight(24)
         self.pause_resume_button.setToolTip("Pause")
@@ -169,7 +174,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
         # Stop button
         self.stop_button = QtWidgets.QPushButton()
-        self.stop_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaStop))
+        self.stop_button.setIcon(self._style.standardIcon(QtWidgets.QStyle.SP_MediaStop))
         self.stop_button.setMaximumWidth(24)
         self.stop_button.setMaximumHeight(24)
         self.stop_button.setToolTip("Stop")
@@ -178,7 +183,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
         # Settings/expand button
         self.expand_button = QtWidgets.QPushButton()
-        self.expand_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_ToolBarVerticalExtensionButton))
+        self.expand_button.setIcon(self._style.standardIcon(QtWidgets.QStyle.SP_ToolBarVerticalExtensionButton))
         self.expand_button.setMaximumWidth(24)
         self.expand_button.setMaximumHeight(24)
         self.expand_button.setToolTip("Open Main Window")
@@ -187,7 +192,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
         # Pin button to toggle auto-hide
         self.pin_button = QtWidgets.QPushButton()
-        self.pin_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DialogApplyButton))
+        self.pin_button.setIcon(self._style.standardIcon(QtWidgets.QStyle.SP_DialogApplyButton))
         self.pin_button.setMaximumWidth(24)
         self.pin_button.setMaximumHeight(24)
         self.pin_button.setToolTip("Pin (Disable Auto-hide)")
@@ -263,7 +268,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
         if timer_state == TimerState.RUNNING:
             self.start_button.setEnabled(False)
             self.pause_resume_button.setEnabled(True)
-            self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause))
+            self.pause_resume_button.setIcon(self._icon_pause)
             self.pause_resume_button.setToolTip("Pause")
             self.stop_button.setEnabled(True)
 
@@ -276,7 +281,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
         elif timer_state in [TimerState.PAUSED, TimerState.IDLE]:
             self.start_button.setEnabled(False)
             self.pause_resume_button.setEnabled(True)
-            self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
+            self.pause_resume_button.setIcon(self._icon_play)
             self.pause_resume_button.setToolTip("Resume")
             self.stop_button.setEnabled(True)
 
@@ -297,12 +302,6 @@ class FloatingPillWidget(QtWidgets.QWidget):
                     "background-color: rgba(60, 80, 120, 240); border-radius: 15px; border: 1px solid rgba(100, 150, 200, 200);"
                 )
 
-        # Have the time tracker check for idle/long pause
-        if timer_state == TimerState.RUNNING:
-            self.ui_service.time_tracker.check_idle()
-        elif timer_state in [TimerState.PAUSED, TimerState.IDLE]:
-            self.ui_service.time_tracker.check_long_pause()
-
     def toggle_pause_resume(self):
         """
         Toggle between pause and resume based on current timer state.
@@ -504,8 +503,7 @@ class FloatingPillWidget(QtWidgets.QWidget):
             self.expand_widget()
 
         # Cancel any pending hide timer
-        if hasattr(self, 'hide_timer'):
-            self.hide_timer.stop()
+        self.hide_timer.stop()
 
         super().enterEvent(event)
 
@@ -519,9 +517,8 @@ class FloatingPillWidget(QtWidgets.QWidget):
 
     def restart_hide_timer(self):
         """Restart the timer for auto-hiding."""
-        if hasattr(self, 'hide_timer'):
-            self.hide_timer.stop()
-            self.hide_timer.start(self.auto_hide_delay)
+        self.hide_timer.stop()
+        self.hide_timer.start(self.auto_hide_delay)
 
     def check_mouse_for_autohide(self):
         """Check if mouse is still outside the widget and hide if appropriate."""
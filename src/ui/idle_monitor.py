@@ -0,0 +1,65 @@
+from PyQt5 import QtCore
+
+
+class IdleMonitorThread(QtCore.QThread):
+    """
+    Background thread that watches for system idle and long pauses.
+
+    Querying the OS for the last input time happens on this thread rather
+    than the GUI thread. Results are delivered to the UI through signals,
+    which Qt queues onto the receiver's thread.
+    """
+
+    # Emitted when the timer is running and the system has been idle too long
+    idle_detected = QtCore.pyqtSignal()
+
+    # Emitted with the pause duration (seconds) when paused for too long
+    long_pause = QtCore.pyqtSignal(float)
+
+    def __init__(self, time_tracker, interval=5000, parent=None):
+        """
+        Initialize the idle monitor.
+
+        Args:
+            time_tracker (TimeTracker): The time tracker to monitor
+            interval (int): Polling interval in milliseconds. The idle and
+                long-pause thresholds are minutes long, so a few seconds is plenty
+            parent: Parent QObject, if any
+        """
+        super().__init__(parent)
+        self.time_tracker = time_tracker
+        self.interval = interval
+
+    def run(self):
+        """
+        Poll the time tracker until an interruption is requested.
+        """
+        while not self.isInterruptionRequested():
+            self._sleep()
+            if self.isInterruptionRequested():
+                break
+
+            # The tracker owns the idle and long-pause rules, these checks have no side effects
+            tracker = self.time_tracker
+            if tracker.idle_seconds():
+                self.idle_detected.emit()
+                continue
+
+            pause_duration = tracker.pause_duration()
+            if pause_duration:
+                self.long_pause.emit(pause_duration)
+
+    def stop(self):
+        """
+        Stop the monitor and wait for the thread to finish.
+        """
+        self.requestInterruption()
+        self.wait()
+
+    def _sleep(self):
+        """Sleep for one polling interval, waking early if interrupted."""
+        remaining = self.interval
+        while remaining > 0 and not self.isInterruptionRequested():
+            step = min(remaining, 100)
+            self.msleep(step)
+            remaining -= step
@@ -1,14 +1,23 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
-from src.utils.time_tracker import TimerState, PauseReason, TimeTracker
-from src.services.ui_service import UIService
+from src.utils.time_tracker import TimerState, PauseReason, TimeTracker, PAUSED_STATES
 from src.services.task_manager import TaskManager
 from src.ui.system_tray import SystemTrayIcon
 from src.ui.task_dialog import TaskDialog
 from src.utils.logger import AppLogger
 from src.ui.floating_pill import FloatingPillWidget
+from src.ui.idle_monitor import IdleMonitorThread
+from src.ui.sync_worker import SyncWorker
+from src.ui.startup_worker import StartupWorker
 from src.utils.path_utils import get_project_root
+from src.utils.notification_utils import NotificationManager
+import logging
 import os
 
+# Resolved once at import rather than on every window construction
+_PROJECT_ROOT = get_project_root()
+_LOG_DIR = os.path.join(_PROJECT_ROOT, 'logs')
+_START_MINIMIZED = os.environ.get('START_MINIMIZED') == '1'
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """
@@ -27,13 +36,97 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         super().__init__(parent)
 
+        # Created in _late_init, state changes may fire before then
+        self.system_tray = None
+
+        # Shows notifications, through the tray once it exists
+        self.notifications = NotificationManager(self)
+
         # Initialize logger
-        log_dir = os.path.join(get_project_root(), 'logs')
-        self.logger = AppLogger(log_dir)
+        self.logger = AppLogger(_LOG_DIR)
         self.logger.info("Initializing main window")
 
-        # Initialize services
-        self.ui_service = UIService()
+        # The style is shared by the whole application, look it up once
+        self._style = QtWidgets.QApplication.instance().style()
+
+        # Widgets created on first use
+        self.floating_pill = None
+        self._task_dialog = None
+
+        # Cached unsynced task count, re-queried only after it is invalidated
+        self._unsynced_cache = None
+        self._unsynced_count_dirty = True
+        self._sync_status_pending = False
+
+        # Last values shown in the sync status and long-pause labels
+        self._prev_unsynced = -1
+        self._last_pause_minutes = -1
+
+        # Services are created by the startup worker, see _on_services_ready
+        self.ui_service = None
+        self.task_manager = None
+        self.idle_monitor = None
+
+        # Thread used for Google Sheets syncs, one at a time
+        self._sync_thread = QtCore.QThread(self)
+        self._sync_worker = None
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._wait_for_sync)
+
+        # Set when the user asked to sync before exiting
+        self._quit_after_sync = False
+
+        # Set up UI components
+        self._load_icons()
+        self.setup_ui()
+        self._build_dialogs()
+        self.logger.debug("UI components initialized")
+
+        # Window properties
+        self.setWindowTitle("Productivity Tracker")
+        self.resize(400, 200)
+
+        # If we started minimized to system tray, hide the main window
+        if _START_MINIMIZED:
+            self.hide()
+        else:
+            # Otherwise make sure the main window is visible and active
+            self.show()
+            self.raise_()
+            self.activateWindow()
+
+        # Open the database and services off the GUI thread, the tray and
+        # pill are built once they are ready
+        self._start_services()
+        self.logger.info("Main window initialization complete")
+
+    def _start_services(self):
+        """
+        Create the backend services on a startup worker thread.
+        """
+        self._startup_thread = QtCore.QThread(self)
+        self._startup_worker = StartupWorker()
+        self._startup_worker.moveToThread(self._startup_thread)
+
+        self._startup_thread.started.connect(self._startup_worker.run)
+        self._startup_worker.ready.connect(self._on_services_ready)
+        self._startup_worker.failed.connect(self._on_services_failed)
+        self._startup_worker.ready.connect(self._startup_thread.quit)
+        self._startup_worker.failed.connect(self._startup_thread.quit)
+        self._startup_thread.finished.connect(self._startup_worker.deleteLater)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._startup_thread.wait)
+
+        self._startup_thread.start()
+        self.logger.debug("Startup worker started")
+
+    def _on_services_ready(self, ui_service, unsynced_count):
+        """
+        Connect the services created by the startup worker to the UI.
+
+        Args:
+            ui_service (UIService): The UI service
+            unsynced_count (int): Number of unsynced tasks at startup
+        """
+        self.ui_service = ui_service
         self.task_manager = TaskManager(self.ui_service)
 
         # Connect callbacks from service to UI methods
@@ -42,18 +135,50 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui_service.register_long_pause_callback(self.handle_long_pause)
         self.logger.debug("Connected UI service callbacks")
 
-        # Set up UI components
-        self.setup_ui()
-        self.logger.debug("UI components initialized")
+        # Poll for idle and long pauses off the GUI thread
+        self.idle_monitor = IdleMonitorThread(self.ui_service.time_tracker, parent=self)
+        self.idle_monitor.idle_detected.connect(self._on_idle_monitor_idle)
+        self.idle_monitor.long_pause.connect(self._on_idle_monitor_long_pause)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.idle_monitor.stop)
+        self.idle_monitor.start()
+        self.logger.debug("Idle monitor started")
 
+        # The worker already read the count, no need to query it again
+        self._unsynced_cache = unsynced_count
+        self._unsynced_count_dirty = False
+
+        self.start_button.setEnabled(True)
+        self._late_init()
+
+    def _on_services_failed(self, error):
+        """
+        Report a failure to create the backend services and exit.
+
+        Args:
+            error (str): Error message from the startup worker
+        """
+        self.logger.critical("Failed to initialize services: %s", error)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Startup Error",
+            f"Productivity Tracker could not start:\n{error}"
+        )
+        QtWidgets.QApplication.instance().quit()
+
+    def _late_init(self):
+        """
+        Set up the system tray, floating pill and sync status.
+
+        Called once the services are ready.
+        """
         # Initialize system tray
-        print("About to initialize system tray icon")
+        self.logger.debug("About to initialize system tray icon")
         self.system_tray = SystemTrayIcon(self)
-        print("System tray icon initialized")
+        self.logger.debug("System tray icon initialized")
 
         # Verify parent is properly set
-        print(f"Parent set: {self.system_tray.parent_window is not None}")
-        print(f"Parent is self: {self.system_tray.parent_window is self}")
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug("Tray parent is main window: %s", self.system_tray.parent_window is self)
         self.system_tray.setup(self.toggle_window_visibility,
                                self.start_task_dialog,
                                self.pause_task,
@@ -63,60 +188,54 @@ class MainWindow(QtWidgets.QMainWindow):
                                self.close)
         self.logger.debug("System tray initialized")
 
+        # Notifications go through the tray from now on
+        self.notifications.set_tray(self.system_tray)
+
         # Ensure system tray icon is visible
         self.system_tray.show()
 
-        # Make sure the main window is visible and active
-        self.show()
-        self.raise_()
-        self.activateWindow()
-
         # Update the system tray icon to reflect current state
-        if hasattr(self, 'ui_service'):
-            current_state = self.ui_service.get_timer_state()
-            self.system_tray.update_actions(current_state)
-
-        # If we started minimized to system tray, hide the main window
-        if os.environ.get('START_MINIMIZED') == '1':
-            self.hide()
-        else:
-            # Otherwise make sure the main window is visible and active
-            self.show()
-            self.raise_()
-            self.activateWindow()
-
-        # Update the system tray icon to reflect current state
-        if self.ui_service:
-            current_state = self.ui_service.get_timer_state()
-            self.system_tray.update_actions(current_state)
+        current_state = self.ui_service.get_timer_state()
+        self.system_tray.update_actions(current_state)
 
         # Call test_icons to ensure icons are loaded properly
         # self.system_tray.test_icons()  # Uncomment for debugging if needed
 
-        # Window properties
-        self.setWindowTitle("Productivity Tracker")
-        self.resize(400, 200)
+        # Show the dockable floating pill, built on first use
+        self._ensure_pill()
+        self.floating_pill.show()
+        # Ensure the floating pill is brought to front
+        self.floating_pill.raise_()
 
         # Update unsynced tasks count
         self.update_sync_status()
-        self.logger.info("Main window initialization complete")
+        self.logger.info("Deferred UI initialization complete")
 
-        # Initialize the dockable floating pill as a separate window
-        self.floating_pill = FloatingPillWidget(self)
-        # Make sure it's a top-level window
-        self.floating_pill.setParent(None)
-        # Force a position in the visible area of the screen before showing
-        screen = QtWidgets.QApplication.primaryScreen().availableGeometry()
-        self.floating_pill.move((screen.width() - self.floating_pill.width()) // 2, 40)
-        # Set the proper size - ensure it's wide enough
-        self.floating_pill.resize(320, 40)
-        # Show the floating pill
-        self.floating_pill.show()
-        # Ensure the floating pill is brought to front
-        self.floating_pill.raise_()
+    def _ensure_pill(self):
+        """
+        Create the floating pill widget if it hasn't been created yet.
 
-        # Start with main window hidden
-        self.hide()
+        Returns:
+            FloatingPillWidget: The floating pill widget
+        """
+        if self.floating_pill is None:
+            self.floating_pill = FloatingPillWidget(self)
+            # Make sure it's a top-level window
+            self.floating_pill.setParent(None)
+            # Force a position in the visible area of the screen before showing
+            screen = QtWidgets.QApplication.primaryScreen().availableGeometry()
+            self.floating_pill.move((screen.width() - self.floating_pill.width()) // 2, 40)
+            # Set the proper size - ensure it's wide enough
+            self.floating_pill.resize(320, 40)
+        return self.floating_pill
+
+    def _load_icons(self):
+        """
+        Look up the standard icons used by the window once so they can be reused.
+        """
+        self._icon_play = self._style.standardIcon(QtWidgets.QStyle.SP_MediaPlay)
+        self._icon_pause = self._style.standardIcon(QtWidgets.QStyle.SP_MediaPause)
+        self._icon_stop = self._style.standardIcon(QtWidgets.QStyle.SP_MediaStop)
 
     def setup_ui(self):
         """
@@ -132,11 +251,11 @@ class MainWindow(QtWidgets.QMainWindow):
         task_layout = QtWidgets.QVBoxLayout(self.task_frame)
 
         self.task_name_label = QtWidgets.QLabel("No task running")
-        self.task_name_label.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        self.task_name_label.setObjectName("TaskName")
         task_layout.addWidget(self.task_name_label)
 
         self.timer_label = QtWidgets.QLabel("00:00:00")
-        self.timer_label.setStyleSheet("font-size: 24pt; font-weight: bold;")
+        self.timer_label.setObjectName("Timer")
         self.timer_label.setAlignment(QtCore.Qt.AlignCenter)
         task_layout.addWidget(self.timer_label)
 
@@ -146,18 +265,23 @@ class MainWindow(QtWidgets.QMainWindow):
         button_layout = QtWidgets.QHBoxLayout()
 
         self.start_button = QtWidgets.QPushButton("Start New Task")
-        self.start_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
-        button_layout.addWidget(self.start_button)
+        # Enabled once the services have been created
+        self.start_button.setEnabled(False)
 
         self.pause_resume_button = QtWidgets.QPushButton("Pause")
-        self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause))
         self.pause_resume_button.setEnabled(False)
-        button_layout.addWidget(self.pause_resume_button)
 
         self.stop_button = QtWidgets.QPushButton("Stop")
-        self.stop_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaStop))
         self.stop_button.setEnabled(False)
-        button_layout.addWidget(self.stop_button)
+
+        buttons = [
+            (self.start_button, self._icon_play),
+            (self.pause_resume_button, self._icon_pause),
+            (self.stop_button, self._icon_stop),
+        ]
+        for button, icon in buttons:
+            button.setIcon(icon)
+            button_layout.addWidget(button)
 
         self.main_layout.addLayout(button_layout)
 
@@ -178,10 +302,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.main_layout.addWidget(self.status_frame)
 
+        # Style the labels with a single sheet so Qt parses it once
+        self.central_widget.setStyleSheet(
+            "#TaskName { font-size: 14pt; font-weight: bold; }"
+            "#Timer { font-size: 24pt; font-weight: bold; }"
+        )
+
+        # Whether the idle/long-pause warning styles are currently applied
+        self._task_frame_styled = False
+        self._status_label_styled = False
+
         # Setup timer for updates
+        self._last_elapsed_seconds = -1
         self.update_timer = QtCore.QTimer(self)
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
+        # Started and stopped by handle_state_change as tasks run
+
+        # Log the running time once a minute, separate from the display tick
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._log_timer.setInterval(60000)
+        self._log_timer.timeout.connect(self._log_running_time)
 
         # Connect buttons
         self.start_button.clicked.connect(self.start_task_dialog)
@@ -189,6 +330,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_button.clicked.connect(self.stop_task)
         self.sync_button.clicked.connect(self.sync_to_sheets)
 
+    def _build_dialogs(self):
+        """
+        Build the recurring message boxes once so they can be reused.
+        """
+        # Idle notification, non-modal so it doesn't block the application
+        self._idle_dialog = QtWidgets.QMessageBox(self)
+        self._idle_dialog.setWindowTitle("Productivity Tracker")
+        self._idle_dialog.setText("Idle Detected")
+        self._idle_dialog.setIcon(QtWidgets.QMessageBox.Information)
+        resume_button = self._idle_dialog.addButton("Resume", QtWidgets.QMessageBox.AcceptRole)
+        self._idle_dialog.addButton("Dismiss", QtWidgets.QMessageBox.RejectRole)
+        self._idle_dialog.setWindowModality(QtCore.Qt.NonModal)
+        resume_button.clicked.connect(self.resume_task)
+
+        # Stop confirmation
+        self._confirm_stop_box = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Question,
+            'Confirm Stop',
+            'Are you sure you want to stop the current task?',
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+            self
+        )
+
+        # Sync result, text and icon are set per use
+        self._sync_result_box = QtWidgets.QMessageBox(self)
+        self._sync_result_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
+
     def handle_state_change(self, new_state):
         """
         Update UI when the timer state changes.
@@ -196,56 +364,125 @@ class MainWindow(QtWidgets.QMainWindow):
         Args:
             new_state (TimerState): The new state of the timer
         """
-        self.logger.debug(f"Timer state changed to: {new_state.name}")
+        self.logger.debug("Timer state changed to: %s", new_state.name)
+
+        # A new pause gets its own long-pause warning
+        self._last_pause_minutes = -1
 
         # Preserve task name even during idle
         current_task = self.ui_service.get_current_task_name()
 
         # Update status label based on new state
         if new_state == TimerState.RUNNING:
-            self.status_label.setText("Running")
+            self._set_text_if_changed(self.status_label, "Running")
             # Update the pause/resume button to show "Pause"
-            self.pause_resume_button.setText("Pause")
-            self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause))
+            self._set_pause_resume_button("Pause", self._icon_pause)
+
+            # Tick every second while running, starting from the current time.
+            # A coarse timer may drift up to 5%, which shows up as skipped seconds
+            self._start_update_timer(1000, QtCore.Qt.PreciseTimer)
+            self.update_display()
+            self._log_timer.start()
 
             # Enable control buttons
             self.pause_resume_button.setEnabled(True)
             self.stop_button.setEnabled(True)
 
-            self.logger.info(f"Timer started for task: '{current_task}'")
+            self.logger.info("Timer started for task: '%s'", current_task)
 
         elif new_state == TimerState.PAUSED:
-            self.status_label.setText("Paused (User)")
+            self._set_text_if_changed(self.status_label, "Paused (User)")
             # Update the pause/resume button to show "Resume"
-            self.pause_resume_button.setText("Resume")
-            self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
+            self._set_pause_resume_button("Resume", self._icon_play)
+
+            # The elapsed time is frozen while paused, so tick slowly
+            self._start_update_timer(5000, QtCore.Qt.CoarseTimer)
+            self._log_timer.stop()
 
             self.logger.info("Timer paused by user")
 
         elif new_state == TimerState.IDLE:
-            self.status_label.setText("Paused (Idle)")
+            self._set_text_if_changed(self.status_label, "Paused (Idle)")
             # Update the pause/resume button to show "Resume"
-            self.pause_resume_button.setText("Resume")
-            self.pause_resume_button.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
+            self._set_pause_resume_button("Resume", self._icon_play)
+
+            # The elapsed time is frozen while idle, so tick slowly
+            self._start_update_timer(5000, QtCore.Qt.CoarseTimer)
+            self._log_timer.stop()
 
             self.logger.info("Timer paused due to system idle")
 
         elif new_state == TimerState.STOPPED:
-            self.status_label.setText("Ready")
+            self._set_text_if_changed(self.status_label, "Ready")
             # Reset task name and disable buttons
-            self.task_name_label.setText("No task running")
+            self._set_text_if_changed(self.task_name_label, "No task running")
             self.pause_resume_button.setEnabled(False)
             self.stop_button.setEnabled(False)
 
+            # Nothing to update until the next task starts
+            self.update_timer.stop()
+            self._log_timer.stop()
+            self._last_elapsed_seconds = -1
+            self.timer_label.setText("00:00:00")
+
             self.logger.info("Timer stopped")
 
             # Check if we need to update sync status after stopping
-            self.update_sync_status()
+            self._schedule_sync_status_update()
+
+        # The idle prompt is stale once the timer is no longer idle
+        if new_state != TimerState.IDLE and self._idle_dialog.isVisible():
+            self._idle_dialog.hide()
 
         # If the system tray is initialized, update its action states
-        if hasattr(self, 'system_tray'):
+        if self.system_tray is not None:
             self.system_tray.update_actions(new_state)
 
+    def _start_update_timer(self, interval, timer_type):
+        """
+        Restart the display timer with the given interval and accuracy.
+
+        Args:
+            interval (int): Tick interval in milliseconds
+            timer_type (Qt.TimerType): Timer accuracy to request from Qt
+        """
+        self.update_timer.setTimerType(timer_type)
+        self.update_timer.start(interval)
+
+    def _set_text_if_changed(self, widget, text):
+        """
+        Set a widget's text, skipping the update if it already shows that text.
+
+        Args:
+            widget: A QLabel or QAbstractButton
+            text (str): The text to display
+        """
+        if widget.text() != text:
+            widget.setText(text)
+
+    def _set_pause_resume_button(self, text, icon):
+        """
+        Switch the pause/resume button between its "Pause" and "Resume" modes.
+
+        Args:
+            text (str): Button text
+            icon (QIcon): Icon shown with the text
+        """
+        if self.pause_resume_button.text() != text:
+            self.pause_resume_button.setText(text)
+            self.pause_resume_button.setIcon(icon)
+
+    def _clear_warning_styles(self):
+        """
+        Remove the idle/long-pause warning styles, if any are applied.
+        """
+        if self._status_label_styled:
+            self.status_label.setStyleSheet("")
+            self._status_label_styled = False
+        if self._task_frame_styled:
+            self.task_frame.setStyleSheet("")
+            self._task_frame_styled = False
+
     def handle_idle_detected(self):
         """
         Handle system idle detection, update UI and show notification.
@@ -253,45 +490,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.logger.info("System idle detected, timer paused automatically")
 
         # Change status label to indicate idle state
-        self.status_label.setText("Paused (Idle detected)")
+        self._set_text_if_changed(self.status_label, "Paused (Idle detected)")
 
         # Change the background color to visually indicate idle state
-        self.task_frame.setStyleSheet("QGroupBox { background-color: #FFEEEE; }")
+        if not self._task_frame_styled:
+            self.task_frame.setStyleSheet("QGroupBox { background-color: #FFEEEE; }")
+            self._task_frame_styled = True
 
         # Show a popup dialog
         task_name = self.ui_service.get_current_task_name()
 
-        # Use a non-modal dialog so it doesn't block the application
-        idle_dialog = QtWidgets.QMessageBox(self)
-        idle_dialog.setWindowTitle("Productivity Tracker")
-        idle_dialog.setText("Idle Detected")
-
         # Include the task name in the message
         if task_name:
-            idle_dialog.setInformativeText(
+            self._idle_dialog.setInformativeText(
                 f"Timer for task \"{task_name}\" has been paused due to inactivity.\n"
                 "Click 'Resume' to continue tracking."
             )
         else:
-            idle_dialog.setInformativeText(
+            self._idle_dialog.setInformativeText(
                 "Timer has been paused due to inactivity.\n"
                 "Click 'Resume' to continue tracking."
             )
 
-        idle_dialog.setIcon(QtWidgets.QMessageBox.Information)
-
-        # Add Resume button
-        resume_button = idle_dialog.addButton("Resume", QtWidgets.QMessageBox.AcceptRole)
-        idle_dialog.addButton("Dismiss", QtWidgets.QMessageBox.RejectRole)
-
-        # Make the dialog non-modal so it doesn't block the application
-        idle_dialog.setWindowModality(QtCore.Qt.NonModal)
-
         # Show the dialog
-        idle_dialog.show()
-
-        # Connect the clicked signal of the Resume button
-        resume_button.clicked.connect(self.resume_task)
+        self._idle_dialog.show()
 
     def handle_long_pause(self, duration):
         """
@@ -303,24 +525,62 @@ class MainWindow(QtWidgets.QMainWindow):
         # Format duration in minutes for display
         minutes = int(duration / 60)
 
-        self.logger.warning(f"Timer has been paused for {minutes} minutes")
+        # Reported on every poll, only act when the minute changes
+        if minutes == self._last_pause_minutes:
+            return
+        self._last_pause_minutes = minutes
+
+        self.logger.warning("Timer has been paused for %d minutes", minutes)
 
         # Highlight the status label to draw attention
-        self.status_label.setStyleSheet("color: red; font-weight: bold;")
-        self.status_label.setText(f"Paused for {minutes} min!")
+        if not self._status_label_styled:
+            self.status_label.setStyleSheet("color: red; font-weight: bold;")
+            self._status_label_styled = True
+        self._set_text_if_changed(self.status_label, f"Paused for {minutes} min!")
 
         # Flash the window to get user's attention if it's not active
         if not self.isActiveWindow() and self.isVisible():
             QtWidgets.QApplication.alert(self)
 
+    def _on_idle_monitor_idle(self):
+        """
+        Pause the timer when the idle monitor reports system inactivity.
+        """
+        tracker = self.ui_service.time_tracker
+
+        # The state may have changed while the signal was queued
+        if tracker.state == TimerState.RUNNING:
+            self.logger.info("System idle reported by idle monitor")
+            tracker.pause(reason=PauseReason.IDLE)
+
+    def _on_idle_monitor_long_pause(self, duration):
+        """
+        Show a long pause reported by the idle monitor.
+
+        The first report of a pause raises the alert (log and notification)
+        through the service, which then calls handle_long_pause; later reports
+        only update the status label.
+
+        Args:
+            duration (float): The duration of the pause in seconds
+        """
+        tracker = self.ui_service.time_tracker
+
+        # The state may have changed while the signal was queued
+        if tracker.state not in PAUSED_STATES:
+            return
+
+        if not tracker.alert_long_pause(duration):
+            self.handle_long_pause(duration)
+
     # In MainWindow class
     def start_task_dialog(self):
         """Show dialog to enter a new task and start the timer."""
         try:
             self.logger.debug("Opening task dialog")
 
-            # Create and show the task dialog
-            dialog = TaskDialog(self)
+            # Show the task dialog
+            dialog = self._get_task_dialog()
             result = dialog.exec_()
 
             # If dialog was accepted (OK clicked)
@@ -337,16 +597,14 @@ class MainWindow(QtWidgets.QMainWindow):
                     )
                     return
 
-                self.logger.debug(
-                    f"Starting new task: '{task_name}', Category: {category}, Disable Idle: {disable_idle}")
+                self.logger.debug("Starting new task: '%s', Category: %s, Disable Idle: %s",
+                                  task_name, category, disable_idle)
 
                 # Start the task directly
                 self.start_task(task_name, description, category, disable_idle)
 
         except Exception as e:
-            self.logger.error(f"Error in start_task_dialog: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error in start_task_dialog: %s", e)
 
             # Show error to user
             QtWidgets.QMessageBox.critical(
@@ -355,11 +613,24 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"An error occurred while starting the task: {str(e)}"
             )
 
+    def _get_task_dialog(self):
+        """
+        Get the task dialog, creating it on first use and clearing it otherwise.
+
+        Returns:
+            TaskDialog: A task dialog ready to be shown
+        """
+        if self._task_dialog is None:
+            self._task_dialog = TaskDialog(self)
+        else:
+            self._task_dialog.reset()
+        return self._task_dialog
+
     def start_task(self, task_name, description=None, category=None, disable_idle=False):
         """Start the timer with the given task name."""
         try:
-            self.logger.debug(
-                f"Starting task: {task_name}, description: {description}, category: {category}, disable_idle: {disable_idle}")
+            self.logger.debug("Starting task: %s, description: %s, category: %s, disable_idle: %s",
+                              task_name, description, category, disable_idle)
 
             # Start the task in the service
             success = self.ui_service.start_task(task_name, description, category, disable_idle)
@@ -373,14 +644,11 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.stop_button.setEnabled(True)
 
                 # Reset any warning styles
-                self.status_label.setStyleSheet("")
-                self.task_frame.setStyleSheet("")
+                self._clear_warning_styles()
 
             return success
         except Exception as e:
-            self.logger.error(f"Error in start_task: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error in start_task: %s", e)
 
             # Show error to user
             QtWidgets.QMessageBox.critical(
@@ -429,8 +697,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if success:
             self.logger.debug("Task resumed successfully")
             # Reset any warning styles that might have been applied
-            self.status_label.setStyleSheet("")
-            self.task_frame.setStyleSheet("")
+            self._clear_warning_styles()
         else:
             self.logger.warning("Failed to resume task")
 
@@ -443,36 +710,38 @@ class MainWindow(QtWidgets.QMainWindow):
         self.logger.debug("Stop task requested")
 
         # Ask for confirmation
-        reply = QtWidgets.QMessageBox.question(
-            self,
-            'Confirm Stop',
-            'Are you sure you want to stop the current task?',
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-            QtWidgets.QMessageBox.No
-        )
+        self._confirm_stop_box.setDefaultButton(QtWidgets.QMessageBox.No)
+        reply = self._confirm_stop_box.exec_()
 
         if reply == QtWidgets.QMessageBox.Yes:
             self.logger.info("Stopping current task")
 
             # Stop the task and save to database
-            result = self.ui_service.stop_task()
+            success, unsynced_count = self.ui_service.stop_task()
 
-            if result:
+            if success:
                 self.logger.info("Task stopped and saved to database")
 
-                # Update sync status since we added a new task
+                # Update sync status since we added a new task, the service
+                # already counted the unsynced tasks after saving
+                self._unsynced_cache = unsynced_count
+                self._unsynced_count_dirty = False
                 self.update_sync_status()
 
                 # Ask if user wants to sync now
-                self.ask_to_sync()
+                self.ask_to_sync(unsynced_count)
             else:
                 self.logger.warning("Failed to stop task or no task was running")
 
-    def ask_to_sync(self):
+    def ask_to_sync(self, unsynced_count=None):
         """
         Ask the user if they want to sync tasks to Google Sheets now.
+
+        Args:
+            unsynced_count (int, optional): Number of unsynced tasks, looked up if not given
         """
-        unsynced_count = self.ui_service.get_unsynced_tasks_count()
+        if unsynced_count is None:
+            unsynced_count = self._get_unsynced_count()
 
         if unsynced_count > 0:
             reply = QtWidgets.QMessageBox.question(
@@ -486,7 +755,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if reply == QtWidgets.QMessageBox.Yes:
                 # Create a separate non-blocking timer to call sync
                 # This prevents the sync action from being in the same call stack as the dialog
-                QtCore.QTimer.singleShot(100, self.sync_to_sheets)
+                QtCore.QTimer.singleShot(100, QtCore.Qt.CoarseTimer, self.sync_to_sheets)
 
     def toggle_window_visibility(self):
         """
@@ -503,76 +772,114 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         Sync unsynced tasks to Google Sheets.
         """
+        if self._sync_thread.isRunning():
+            self.logger.info("Sync already in progress, ignoring request")
+            return
+
         self.logger.info("Starting sync to Google Sheets")
 
         # Show a progress dialog
         progress_dialog = QtWidgets.QProgressDialog("Syncing to Google Sheets...", "Cancel", 0, 0, self)
         progress_dialog.setWindowTitle("Syncing")
         progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
-        progress_dialog.show()
-
-        # Create a separate thread for sync operation
-        QtCore.QTimer.singleShot(100, lambda: self._do_sync(progress_dialog))
-
-    def _do_sync(self, progress_dialog):
+        # Only pop up if the sync is still running after half a second
+        progress_dialog.setMinimumDuration(500)
+        progress_dialog.setValue(0)
+        self._sync_progress_dialog = progress_dialog
+
+        # Run the sync on the worker thread so the UI stays responsive
+        self._sync_worker = SyncWorker(self.ui_service)
+        self._sync_worker.moveToThread(self._sync_thread)
+        self._sync_thread.started.connect(self._sync_worker.run)
+        self._sync_worker.finished.connect(self._on_sync_finished)
+        self._sync_worker.finished.connect(self._sync_thread.quit)
+        self._sync_thread.finished.connect(self._sync_worker.deleteLater)
+        self._sync_thread.start()
+
+    def _on_sync_finished(self, success, error):
         """
-        Perform the actual sync operation and update UI when complete.
+        Close the progress dialog and show the result of a sync.
 
         Args:
-            progress_dialog (QProgressDialog): Progress dialog to close when done
+            success (bool): True if the sync was successful
+            error (str): Error message if the sync raised, otherwise empty
         """
-        try:
-            # Perform sync operation
-            success = self.ui_service.sync_to_sheets()
-
-            # Close progress dialog
-            progress_dialog.close()
+        # The next sync gets a fresh worker
+        self._sync_thread.started.disconnect()
 
-            # Show result
-            if success:
-                self.logger.info("Tasks successfully synced to Google Sheets")
-                message_box = QtWidgets.QMessageBox(
-                    QtWidgets.QMessageBox.Information,
-                    "Sync Complete",
-                    "Tasks successfully synced to Google Sheets.",
-                    QtWidgets.QMessageBox.Ok,
-                    self
-                )
-                message_box.exec_()
-            else:
-                self.logger.warning("Failed to sync tasks to Google Sheets")
-                message_box = QtWidgets.QMessageBox(
-                    QtWidgets.QMessageBox.Warning,
-                    "Sync Failed",
-                    "Failed to sync tasks to Google Sheets.",
-                    QtWidgets.QMessageBox.Ok,
-                    self
-                )
-                message_box.exec_()
+        # Close progress dialog, reset() also cancels a pending delayed show
+        self._sync_progress_dialog.reset()
+        self._sync_progress_dialog.deleteLater()
 
-            # Update sync status
-            self.update_sync_status()
-
-        except Exception as e:
-            self.logger.error(f"Error during sync: {str(e)}")
-            progress_dialog.close()
-            message_box = QtWidgets.QMessageBox(
+        # Show result
+        if error:
+            self.logger.error("Error during sync: %s", error)
+            self._show_sync_result(
                 QtWidgets.QMessageBox.Critical,
                 "Sync Error",
-                f"An error occurred while syncing: {str(e)}",
-                QtWidgets.QMessageBox.Ok,
-                self
+                f"An error occurred while syncing: {error}"
+            )
+        elif success:
+            self.logger.info("Tasks successfully synced to Google Sheets")
+            self._show_sync_result(
+                QtWidgets.QMessageBox.Information,
+                "Sync Complete",
+                "Tasks successfully synced to Google Sheets."
             )
-            message_box.exec_()
+        else:
+            self.logger.warning("Failed to sync tasks to Google Sheets")
+            self._show_sync_result(
+                QtWidgets.QMessageBox.Warning,
+                "Sync Failed",
+                "Failed to sync tasks to Google Sheets."
+            )
+
+        # Update sync status
+        self._schedule_sync_status_update()
+
+        # The tray's cached count is stale now that the sync is done
+        if self.system_tray is not None:
+            self.system_tray.invalidate_unsynced_count()
+            self.system_tray.update_actions(self.ui_service.get_timer_state())
+
+        # Finish an exit that was waiting for this sync
+        if self._quit_after_sync:
+            self.logger.info("Sync before exit finished - exiting application")
+            QtWidgets.QApplication.instance().quit()
+
+    def _wait_for_sync(self):
+        """
+        Let a running sync finish before the application exits.
+        """
+        if self._sync_thread.isRunning():
+            self.logger.info("Waiting for sync to finish before exiting")
+            self._sync_thread.quit()
+            self._sync_thread.wait()
+
+    def _show_sync_result(self, icon, title, text):
+        """
+        Show the outcome of a sync in the reusable result message box.
+
+        Args:
+            icon (QMessageBox.Icon): Icon to display
+            title (str): Window title
+            text (str): Message to display
+        """
+        self._sync_result_box.setIcon(icon)
+        self._sync_result_box.setWindowTitle(title)
+        self._sync_result_box.setText(text)
+        self._sync_result_box.exec_()
 
     def update_sync_status(self):
         """
         Update the sync status label and button based on unsynced tasks.
         """
-        # Get count of unsynced tasks
-        unsynced_count = self.ui_service.get_unsynced_tasks_count()
+        unsynced_count = self._get_unsynced_count()
+        if unsynced_count == self._prev_unsynced:
+            return
+        self._prev_unsynced = unsynced_count
 
-        self.logger.debug(f"Updating sync status: {unsynced_count} tasks pending sync")
+        self.logger.debug("Updating sync status: %d tasks pending sync", unsynced_count)
 
         # Update sync status label
         self.sync_status.setText(f"{unsynced_count} tasks pending sync")
@@ -580,31 +887,62 @@ class MainWindow(QtWidgets.QMainWindow):
         # Enable sync button if there are unsynced tasks
         self.sync_button.setEnabled(unsynced_count > 0)
 
+    def _get_unsynced_count(self):
+        """
+        Get the number of unsynced tasks, querying the database only when stale.
+
+        Returns:
+            int: Number of unsynced tasks
+        """
+        if self._unsynced_count_dirty or self._unsynced_cache is None:
+            self._unsynced_cache = self.ui_service.get_unsynced_tasks_count()
+            self._unsynced_count_dirty = False
+        return self._unsynced_cache
+
+    def _schedule_sync_status_update(self):
+        """
+        Mark the cached unsynced count as stale and schedule a single refresh.
+
+        Calls made within 200 ms of each other are coalesced into one label
+        update and at most one database query.
+        """
+        self._unsynced_count_dirty = True
+        if not self._sync_status_pending:
+            self._sync_status_pending = True
+            QtCore.QTimer.singleShot(200, QtCore.Qt.CoarseTimer, self._flush_sync_status)
+
+    def _flush_sync_status(self):
+        """Run the sync status refresh scheduled by _schedule_sync_status_update."""
+        self._sync_status_pending = False
+        self.update_sync_status()
+
     def update_display(self):
         """
         Update the timer display with current elapsed time.
-        Called every second by the update_timer.
+        Called by the update_timer while a task is running or paused.
         """
-        # Get formatted elapsed time
-        elapsed_time = self.ui_service.get_elapsed_time_formatted()
-
-        # Update the timer label
-        self.timer_label.setText(elapsed_time)
+        tracker = self.ui_service.time_tracker
 
-        # Check for idle if timer is running
-        if self.ui_service.time_tracker.state == TimerState.RUNNING:
-            self.ui_service.time_tracker.check_idle()
+        # Nothing on the display changes while no task is running
+        if tracker.state == TimerState.STOPPED:
+            return
 
-        # Check for long pause if timer is paused
-        if self.ui_service.time_tracker.state in [TimerState.PAUSED, TimerState.IDLE]:
-            self.ui_service.time_tracker.check_long_pause()
+        # Only rebuild the label text when the displayed second changes
+        seconds = int(tracker.get_elapsed_time())
+        if seconds != self._last_elapsed_seconds:
+            self._last_elapsed_seconds = seconds
+            self.timer_label.setText(f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}")
 
-        # Log elapsed time every minute (to avoid excessive logging)
-        seconds = int(self.ui_service.time_tracker.get_elapsed_time())
-        if seconds % 60 == 0 and seconds > 0 and self.ui_service.time_tracker.state == TimerState.RUNNING:
-            task_name = self.ui_service.get_current_task_name()
-            minutes = seconds // 60
-            self.logger.debug(f"Task '{task_name}' running for {minutes} minutes")
+    def _log_running_time(self):
+        """
+        Log the elapsed time of the running task.
+        Called by the _log_timer once a minute while a task is running.
+        """
+        if not self.logger.is_enabled_for(logging.DEBUG):
+            return
+        minutes = int(self.ui_service.time_tracker.get_elapsed_time()) // 60
+        task_name = self.ui_service.get_current_task_name()
+        self.logger.debug("Task '%s' running for %d minutes", task_name, minutes)
 
     def closeEvent(self, event):
         """
@@ -615,6 +953,11 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         self.logger.debug("Application close requested")
 
+        # Nothing to save if the services never finished starting
+        if self.ui_service is None:
+            event.accept()
+            return
+
         # If timer is running, ask for confirmation
         if self.ui_service.is_timer_running():
             self.logger.info("Timer still running on exit - prompting user")
@@ -636,10 +979,10 @@ class MainWindow(QtWidgets.QMainWindow):
                 # Cancel the close event
                 event.ignore()
         else:
-            # Check for unsynced tasks and offer to sync
-            unsynced_count = self.ui_service.get_unsynced_tasks_count()
+            # Check for unsynced tasks and offer to sync, reusing the cached count
+            unsynced_count = self._get_unsynced_count()
             if unsynced_count > 0:
-                self.logger.info(f"Unsynced tasks on exit: {unsynced_count} - prompting user")
+                self.logger.info("Unsynced tasks on exit: %d - prompting user", unsynced_count)
                 reply = QtWidgets.QMessageBox.question(
                     self,
                     'Unsynced Tasks',
@@ -650,10 +993,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
                 if reply == QtWidgets.QMessageBox.Yes:
                     self.logger.info("User chose to sync before exit")
-                    # Sync but don't automatically exit (remove auto-termination)
+                    # Keep running until the sync finishes, _on_sync_finished quits
+                    self._quit_after_sync = True
+                    event.ignore()
                     self.sync_to_sheets()
-                    # Only now accept the event
-                    event.accept()
+                    return
                 elif reply == QtWidgets.QMessageBox.No:
                     self.logger.info("User chose to exit without syncing")
                     # Just accept the close event
@@ -693,7 +1037,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.logger.debug("Starting task from floating pill")
 
         # Show the task dialog directly from here
-        dialog = TaskDialog(self)
+        dialog = self._get_task_dialog()
         result = dialog.exec_()
 
         # If dialog was accepted (OK clicked)
@@ -712,8 +1056,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.task_name_label.setText(task_name)
             self.pause_resume_button.setEnabled(True)
             self.stop_button.setEnabled(True)
-            self.status_label.setStyleSheet("")
-            self.task_frame.setStyleSheet("")
+            self._clear_warning_styles()
 
     def update_ui_for_running_task(self, task_name):
         """Update UI elements when a task starts."""
@@ -725,5 +1068,4 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_button.setEnabled(True)
 
         # Reset any warning styles
-        self.status_label.setStyleSheet("")
-        self.task_frame.setStyleSheet("")
+        self._clear_warning_styles()
@@ -0,0 +1,30 @@
+from PyQt5 import QtCore
+from src.services.ui_service import UIService
+
+
+class StartupWorker(QtCore.QObject):
+    """
+    Builds the backend services on a worker thread at startup.
+
+    Opening the database and setting up the service loggers touches the
+    disk, so it is done off the GUI thread while the window is shown. The
+    services are handed back to the UI through the ready signal.
+    """
+
+    # Emitted with (ui_service, unsynced task count) once the services are up
+    ready = QtCore.pyqtSignal(object, int)
+
+    # Emitted with an error message if the services could not be created
+    failed = QtCore.pyqtSignal(str)
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Create the UI service and read the initial unsynced task count.
+        """
+        try:
+            ui_service = UIService()
+            unsynced_count = ui_service.get_unsynced_tasks_count()
+            self.ready.emit(ui_service, unsynced_count)
+        except Exception as e:
+            self.failed.emit(str(e))
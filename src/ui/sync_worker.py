@@ -0,0 +1,36 @@
+from PyQt5 import QtCore
+
+
+class SyncWorker(QtCore.QObject):
+    """
+    Runs a Google Sheets sync on a worker thread.
+
+    The worker is moved to a QThread and its run slot is connected to the
+    thread's started signal. The network and database I/O of the sync
+    happen off the GUI thread; the result is reported back through the
+    finished signal.
+    """
+
+    # Emitted with (success, error message) when the sync is done
+    finished = QtCore.pyqtSignal(bool, str)
+
+    def __init__(self, ui_service):
+        """
+        Initialize the sync worker.
+
+        Args:
+            ui_service (UIService): The service that performs the sync
+        """
+        super().__init__()
+        self.ui_service = ui_service
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Perform the sync and emit the result.
+        """
+        try:
+            success = self.ui_service.sync_to_sheets()
+            self.finished.emit(success, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
@@ -1,9 +1,36 @@
-from PyQt5 import QtWidgets, QtGui
+from PyQt5 import QtWidgets, QtGui, QtCore
 from src.utils.time_tracker import TimerState
-from src.utils.logger import AppLogger
-from src.utils.path_utils import get_project_root
-import os
+from src.utils.logger import get_logger
+import logging
 import sys
+import time
+
+# Tooltip templates, filled in with the current task name
+_TOOLTIP_DEFAULT = "Productivity Tracker"
+_TOOLTIP_READY = "Productivity Tracker - Ready"
+_TOOLTIP_RUNNING = "Productivity Tracker - Running: {}"
+_TOOLTIP_PAUSED = "Productivity Tracker - Paused: {}"
+_TOOLTIP_IDLE = "Productivity Tracker - Idle: {}"
+_TOOLTIP_PENDING = "{} ({} tasks pending sync)"
+
+
+def _solid_icon(rgb):
+    """
+    Get a plain 16x16 icon filled with one color, sharing its pixmap through QPixmapCache.
+
+    Args:
+        rgb (tuple): Red, green and blue components (0-255)
+
+    Returns:
+        QIcon: The colored icon
+    """
+    key = "tray:solid:{},{},{}".format(*rgb)
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(16, 16)
+        pixmap.fill(QtGui.QColor(*rgb))
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return QtGui.QIcon(pixmap)
 
 
 class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
@@ -14,6 +41,36 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
     to app functions without needing the main window to be visible.
     """
 
+    # Enabled flags for the (start, pause, resume, stop) actions, per timer state
+    _ACTION_STATES = {
+        TimerState.RUNNING: (False, True, False, True),
+        TimerState.PAUSED: (False, False, True, True),
+        TimerState.IDLE: (False, False, True, True),
+        TimerState.STOPPED: (True, False, False, False),
+    }
+
+    # Tooltip template per active timer state
+    _STATE_TOOLTIPS = {
+        TimerState.RUNNING: _TOOLTIP_RUNNING,
+        TimerState.PAUSED: _TOOLTIP_PAUSED,
+        TimerState.IDLE: _TOOLTIP_IDLE,
+    }
+
+    # Standard icon shown in the tray for each timer state
+    _STATE_STANDARD_ICONS = {
+        TimerState.RUNNING: QtWidgets.QStyle.SP_MediaPlay,
+        TimerState.PAUSED: QtWidgets.QStyle.SP_MediaPause,
+        TimerState.IDLE: QtWidgets.QStyle.SP_MediaPause,
+        TimerState.STOPPED: QtWidgets.QStyle.SP_MediaStop,
+    }
+
+    # How long an unsynced task count is reused before asking the database again (seconds)
+    UNSYNCED_COUNT_TTL = 2.0
+
+    # Icons shared by all tray icons, filled in on first use
+    _ICON_CACHE = {}
+    _STATE_ICON_CACHE = {}
+
     def __init__(self, parent=None):
         """
         Initialize the system tray icon.
@@ -23,31 +80,70 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
         """
         super().__init__(parent)
 
-        # Store parent reference explicitly
+        # Store parent reference explicitly, used by the toggle function too
         self.parent_window = parent
-        print(f"Parent window set in __init__: {self.parent_window is not None}")
+        self.toggle_func = None
 
         # Initialize logger
-        log_dir = os.path.join(get_project_root(), 'logs')
-        self.logger = AppLogger(log_dir)
+        self.logger = get_logger()
         self.logger.info("Initializing system tray icon")
 
-        self.setToolTip("Productivity Tracker")
+        # Debug messages are only built when the level is enabled
+        self._debug = self.logger.is_enabled_for(logging.DEBUG)
+        if self._debug:
+            self.logger.debug("Parent window set in __init__: %s", self.parent_window is not None)
+
+        self.setToolTip(_TOOLTIP_DEFAULT)
+        self._last_tooltip = _TOOLTIP_DEFAULT
+
+        # Resolve the per-state icons once, shared by all tray icons
+        if not self._STATE_ICON_CACHE:
+            for state, standard_icon in self._STATE_STANDARD_ICONS.items():
+                self._STATE_ICON_CACHE[state] = self._get_icon(standard_icon)
 
         # Set default icon (stopped state)
         self._set_initial_icon()
         self.logger.debug("System tray icon set")
 
         # Connect double-click action to toggle window
-        self.activated.connect(self._on_activated)
-
-        # Store reference to parent for toggle function
-        self.parent_window = parent
-        self.toggle_func = None
+        # Everything here lives on the GUI thread, so call handlers directly
+        self.activated.connect(self._on_activated, QtCore.Qt.DirectConnection)
+
+        # Context menu actions, built by _ensure_menu on first show
+        self._menu = None
+        self._callbacks = {}
+        self.actions = {}
+        self._action_start = None
+        self._action_pause = None
+        self._action_resume = None
+        self._action_stop = None
+        self._action_sync = None
+
+        # What update_actions last applied, to skip repeated updates
+        self._last_state = None
+        self._last_unsynced = -1
+        self._state_tooltip = _TOOLTIP_DEFAULT
+
+        # Bound in setup() once the parent's UI service is available
+        self._ui_service = None
+        self._get_task_name = None
+        self._get_unsynced = None
+
+        # (monotonic timestamp, count) of the last unsynced count lookup
+        self._unsynced_cache = (0.0, 0)
+
+        # Latest state handed to update_actions while a deferred update is queued
+        self._pending_state = None
+        self._update_scheduled = False
 
         # Make sure icon is visible in system tray
         self.setVisible(True)
 
+        # Notification support doesn't change while the app runs
+        self._supports_messages = self.supportsMessages()
+        if not self._supports_messages:
+            self.logger.warning("System does not support tray notifications")
+
         self.logger.info("System tray icon initialized")
 
     def _set_initial_icon(self):
@@ -59,38 +155,47 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
                 self.setIcon(icon)
                 return
             else:
-                # Create a basic icon as last resort
-                pixmap = QtGui.QPixmap(16, 16)
-                pixmap.fill(QtGui.QColor(128, 128, 128))
-                icon = QtGui.QIcon(pixmap)
-                self.setIcon(icon)
+                # Use a basic icon as last resort
+                self.setIcon(_solid_icon((128, 128, 128)))
         except Exception as e:
-            print(f"Error setting system tray icon: {e}")
-            # Create an emergency fallback icon
-            pixmap = QtGui.QPixmap(16, 16)
-            pixmap.fill(QtGui.QColor(255, 0, 0))
-            self.setIcon(QtGui.QIcon(pixmap))
+            self.logger.error("Error setting system tray icon: %s", e)
+            # Use an emergency fallback icon
+            self.setIcon(_solid_icon((255, 0, 0)))
 
     def _get_icon(self, standard_icon):
         """
         Get a standard icon from the parent window or application.
 
+        Icons are cached by their QStyle identifier after the first lookup.
+        The style's QIcon is kept as is so it still renders sharply at every
+        size and device pixel ratio.
+
         Args:
             standard_icon: The standard icon identifier from QtWidgets.QStyle
 
         Returns:
             QIcon: The requested icon
         """
+        icon = self._ICON_CACHE.get(standard_icon)
+        if icon is not None:
+            return icon
+
         if self.parent_window:
-            return self.parent_window.style().standardIcon(standard_icon)
+            style = self.parent_window.style()
         else:
             app = QtWidgets.QApplication.instance()
             if app:
-                return app.style().standardIcon(standard_icon)
-            # Last resort fallback
-            self.logger.warning(f"Couldn't get style for icon {standard_icon}")
-            return QtGui.QIcon()
+                style = app.style()
+            else:
+                # Last resort fallback, not cached so a later call can retry
+                self.logger.warning("Couldn't get style for icon %s", standard_icon)
+                return QtGui.QIcon()
+
+        icon = style.standardIcon(standard_icon)
+        self._ICON_CACHE[standard_icon] = icon
+        return icon
 
+    @QtCore.pyqtSlot(QtWidgets.QSystemTrayIcon.ActivationReason)
     def _on_activated(self, reason):
         """
         Handle tray icon activation (clicks).
@@ -100,14 +205,18 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
         """
         # Toggle window visibility on double click
         if reason == QtWidgets.QSystemTrayIcon.DoubleClick and self.toggle_func:
-            self.logger.debug("System tray icon double-clicked, toggling window visibility")
+            if self._debug:
+                self.logger.debug("System tray icon double-clicked, toggling window visibility")
             self.toggle_func()
         elif reason == QtWidgets.QSystemTrayIcon.Trigger:
-            self.logger.debug("System tray icon single-clicked")
+            if self._debug:
+                self.logger.debug("System tray icon single-clicked")
         elif reason == QtWidgets.QSystemTrayIcon.MiddleClick:
-            self.logger.debug("System tray icon middle-clicked")
+            if self._debug:
+                self.logger.debug("System tray icon middle-clicked")
         elif reason == QtWidgets.QSystemTrayIcon.Context:
-            self.logger.debug("System tray context menu requested")
+            if self._debug:
+                self.logger.debug("System tray context menu requested")
 
     def setup(self, toggle_window_func, start_func, pause_func,
               resume_func, stop_func, sync_func, quit_func):
@@ -128,53 +237,82 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
         # Store toggle function for double-click handling
         self.toggle_func = toggle_window_func
 
-        # Create menu
-        menu = QtWidgets.QMenu()
-        self.logger.debug("Created system tray context menu")
+        # Bind the UI service lookups used on every state change
+        self._ui_service = getattr(self.parent_window, 'ui_service', None)
+        if self._ui_service is not None:
+            self._get_task_name = self._ui_service.get_current_task_name
+            self._get_unsynced = self._ui_service.get_unsynced_tasks_count
+
+        # Keep the callbacks, the menu actions are only built when first shown
+        self._callbacks = {
+            'toggle': toggle_window_func,
+            'start': start_func,
+            'pause': pause_func,
+            'resume': resume_func,
+            'stop': stop_func,
+            'sync': sync_func,
+            'quit': quit_func,
+        }
+
+        # Set an empty context menu that fills itself in on first show
+        self._menu = QtWidgets.QMenu()
+        self._menu.aboutToShow.connect(self._ensure_menu, QtCore.Qt.DirectConnection)
+        self.setContextMenu(self._menu)
+        self.logger.debug("Context menu set for system tray icon")
+
+        # Show the icon
+        self.show()
+        self.logger.info("System tray icon is now visible")
+
+        # Set initial action states
+        self.update_actions(TimerState.STOPPED)
+
+    def _ensure_menu(self):
+        """
+        Build the context menu actions the first time the menu is shown.
+        """
+        if self.actions:
+            return
+
+        self.logger.debug("Building system tray context menu")
+        menu = self._menu
+        callbacks = self._callbacks
 
         # Add actions
         toggle_action = menu.addAction("Show/Hide")
-        toggle_action.triggered.connect(toggle_window_func)
+        toggle_action.triggered.connect(callbacks['toggle'], QtCore.Qt.DirectConnection)
 
         menu.addSeparator()
 
         # Create actions with proper icons using our helper method
         start_action = menu.addAction("Start New Task")
         start_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_MediaPlay))
-        start_action.triggered.connect(start_func)
+        start_action.triggered.connect(callbacks['start'], QtCore.Qt.DirectConnection)
 
         pause_action = menu.addAction("Pause")
         pause_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_MediaPause))
-        pause_action.triggered.connect(pause_func)
+        pause_action.triggered.connect(callbacks['pause'], QtCore.Qt.DirectConnection)
 
         resume_action = menu.addAction("Resume")
         resume_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_MediaPlay))
-        resume_action.triggered.connect(resume_func)
+        resume_action.triggered.connect(callbacks['resume'], QtCore.Qt.DirectConnection)
 
         stop_action = menu.addAction("Stop")
         stop_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_MediaStop))
-        stop_action.triggered.connect(stop_func)
+        stop_action.triggered.connect(callbacks['stop'], QtCore.Qt.DirectConnection)
 
         menu.addSeparator()
 
         sync_action = menu.addAction("Sync to Sheets")
         sync_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_ArrowUp))
-        sync_action.triggered.connect(sync_func)
+        sync_action.triggered.connect(callbacks['sync'], QtCore.Qt.DirectConnection)
 
         menu.addSeparator()
 
         quit_action = menu.addAction("Quit")
         quit_action.setIcon(self._get_icon(QtWidgets.QStyle.SP_DialogCloseButton))
         # Connect to a proper application exit function
-        quit_action.triggered.connect(lambda: self._quit_application(quit_func))
-
-        # Set the context menu
-        self.setContextMenu(menu)
-        self.logger.debug("Context menu set for system tray icon")
-
-        # Show the icon
-        self.show()
-        self.logger.info("System tray icon is now visible")
+        quit_action.triggered.connect(self._on_quit_triggered, QtCore.Qt.DirectConnection)
 
         # Store actions to enable/disable them based on state
         self.actions = {
@@ -185,10 +323,52 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
             'sync': sync_action
         }
 
-        # Set initial action states
-        self.update_actions(TimerState.STOPPED)
+        # Direct references for the per-state updates
+        self._action_start = start_action
+        self._action_pause = pause_action
+        self._action_resume = resume_action
+        self._action_stop = stop_action
+        self._action_sync = sync_action
+
+        # Catch the new actions up with the state update_actions last saw
+        if self._last_state is not None:
+            self._apply_action_states(self._last_state)
+        sync_action.setEnabled(self._last_unsynced > 0)
+
+    def _apply_action_states(self, timer_state):
+        """
+        Enable the start/pause/resume/stop actions that make sense in a state.
+
+        Args:
+            timer_state (TimerState): State to apply
+        """
+        start, pause, resume, stop = self._ACTION_STATES[timer_state]
+        self._action_start.setEnabled(start)
+        self._action_pause.setEnabled(pause)
+        self._action_resume.setEnabled(resume)
+        self._action_stop.setEnabled(stop)
 
     def update_actions(self, timer_state):
+        """
+        Schedule an update of the menu actions for a timer state.
+
+        Calls made within 50 ms of each other are coalesced, only the last
+        state is applied.
+
+        Args:
+            timer_state (TimerState): Current state of the timer
+        """
+        self._pending_state = timer_state
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            QtCore.QTimer.singleShot(50, QtCore.Qt.CoarseTimer, self._flush_update)
+
+    def _flush_update(self):
+        """Apply the state recorded by update_actions."""
+        self._update_scheduled = False
+        self._apply_update_actions(self._pending_state)
+
+    def _apply_update_actions(self, timer_state):
         """
         Update the enabled state of menu actions based on timer state.
 
@@ -196,108 +376,96 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
             timer_state (TimerState): Current state of the timer
         """
         try:
-            self.logger.debug(f"Updating system tray actions for state: {timer_state.name}")
+            if self._debug:
+                self.logger.debug("Updating system tray actions for state: %s", timer_state.name)
+
+            # Stopping saves a task, so the count can't be reused across that
+            if timer_state == TimerState.STOPPED and timer_state != self._last_state:
+                self.invalidate_unsynced_count()
+            unsynced_count = self._unsynced_count()
 
-            # Safely check if actions dict exists
-            if not hasattr(self, 'actions') or not self.actions:
-                self.logger.warning("Actions dict not initialized, can't update actions")
+            # Nothing to do if neither the state nor the sync status changed
+            if timer_state == self._last_state and unsynced_count == self._last_unsynced:
                 return
 
-            if timer_state == TimerState.RUNNING:
-                # When running, can pause or stop but not start or resume
-                self.actions['start'].setEnabled(False)
-                self.actions['pause'].setEnabled(True)
-                self.actions['resume'].setEnabled(False)
-                self.actions['stop'].setEnabled(True)
-
-                # Update tooltip to show currently running task
-                if hasattr(self, 'parent_window') and self.parent_window is not None:
-                    if hasattr(self.parent_window, 'ui_service'):
-                        task_name = self.parent_window.ui_service.get_current_task_name()
-                        if task_name:
-                            tooltip = f"Productivity Tracker - Running: {task_name}"
-                            self.setToolTip(tooltip)
-                            self.logger.debug(f"Updated tooltip: {tooltip}")
-
-                # Change tray icon to indicate running state
-                self.logger.debug(f"Setting icon for state: {timer_state.name}")
-                self._set_icon_for_state(timer_state)
+            if timer_state != self._last_state:
+                task_name = self._get_task_name() if self._ui_service is not None else None
+
+                # Enable the actions that make sense in this state, once the menu exists
+                if self._action_start is not None:
+                    self._apply_action_states(timer_state)
+
+                # Tooltip shows the state and the current task
+                if timer_state == TimerState.STOPPED:
+                    self._state_tooltip = _TOOLTIP_READY
+                elif task_name:
+                    self._state_tooltip = self._STATE_TOOLTIPS[timer_state].format(task_name)
+                else:
+                    self._state_tooltip = _TOOLTIP_DEFAULT
 
-            elif timer_state in [TimerState.PAUSED, TimerState.IDLE]:
-                # When paused/idle, can resume or stop but not start or pause
-                self.actions['start'].setEnabled(False)
-                self.actions['pause'].setEnabled(False)
-                self.actions['resume'].setEnabled(True)
-                self.actions['stop'].setEnabled(True)
-
-                # Update tooltip to show paused state
-                if hasattr(self, 'parent_window') and self.parent_window is not None:
-                    if hasattr(self.parent_window, 'ui_service'):
-                        task_name = self.parent_window.ui_service.get_current_task_name()
-                        if task_name:
-                            state_text = "Paused" if timer_state == TimerState.PAUSED else "Idle"
-                            tooltip = f"Productivity Tracker - {state_text}: {task_name}"
-                            self.setToolTip(tooltip)
-                            self.logger.debug(f"Updated tooltip: {tooltip}")
-
-                # Change tray icon to indicate paused/idle state
-                self.logger.debug(f"Setting icon for state: {timer_state.name}")
+                # Change tray icon to match the state
+                if self._debug:
+                    self.logger.debug("Setting icon for state: %s", timer_state.name)
                 self._set_icon_for_state(timer_state)
 
-            elif timer_state == TimerState.STOPPED:
-                # When stopped, can only start a new task
-                self.actions['start'].setEnabled(True)
-                self.actions['pause'].setEnabled(False)
-                self.actions['resume'].setEnabled(False)
-                self.actions['stop'].setEnabled(False)
+            # Sync button is only enabled if there are unsynced tasks
+            if self._action_sync is not None and (self._last_unsynced < 0 or (unsynced_count > 0) != (self._last_unsynced > 0)):
+                self._action_sync.setEnabled(unsynced_count > 0)
 
-                # Reset tooltip
-                self.setToolTip("Productivity Tracker - Ready")
-                self.logger.debug("Reset tooltip to default (Ready)")
+            self._last_state = timer_state
+            self._last_unsynced = unsynced_count
 
-                # Reset icon
-                self.logger.debug(f"Setting icon for state: {timer_state.name}")
-                self._set_icon_for_state(timer_state)
+            # Add the sync status to the tooltip
+            tooltip = self._state_tooltip
+            if unsynced_count > 0:
+                tooltip = _TOOLTIP_PENDING.format(tooltip, unsynced_count)
 
-            # Sync button is always enabled if there are unsynced tasks
-            if hasattr(self, 'parent_window') and self.parent_window is not None:
-                if hasattr(self.parent_window, 'ui_service'):
-                    try:
-                        unsynced_count = self.parent_window.ui_service.get_unsynced_tasks_count()
-                        self.actions['sync'].setEnabled(unsynced_count > 0)
-
-                        # Update tooltip to show sync status
-                        if unsynced_count > 0:
-                            current_tooltip = self.toolTip()
-                            tooltip = f"{current_tooltip} ({unsynced_count} tasks pending sync)"
-                            self.setToolTip(tooltip)
-                            self.logger.debug(f"Updated tooltip with sync info: {tooltip}")
-                    except Exception as e:
-                        self.logger.error(f"Error getting unsynced task count: {e}")
+            # Only hand the tooltip to Qt when it actually changed
+            if tooltip != self._last_tooltip:
+                self.setToolTip(tooltip)
+                self._last_tooltip = tooltip
+                if self._debug:
+                    self.logger.debug("Updated tooltip: %s", tooltip)
         except Exception as e:
-            print(f"Error in update_actions: {e}")  # Print to console regardless of logger
-            if hasattr(self, 'logger'):
-                self.logger.error(f"Error updating system tray actions: {e}")
+            self.logger.error("Error updating system tray actions: %s", e)
 
-    def _set_icon_for_state(self, state):
+    def _unsynced_count(self):
         """
-        Set the system tray icon based on the current timer state.
-        Simplified to use standard icons for reliability.
+        Get the number of unsynced tasks, reusing a recent lookup.
+
+        Returns:
+            int: Number of unsynced tasks, 0 if it couldn't be looked up
         """
+        if self._ui_service is None:
+            return 0
+
+        timestamp, count = self._unsynced_cache
+        now = time.monotonic()
+        if timestamp and now - timestamp < self.UNSYNCED_COUNT_TTL:
+            return count
+
         try:
-            if state == TimerState.RUNNING:
-                # Use standard Play icon for running
-                icon = self.parent_window.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay)
-            elif state in [TimerState.PAUSED, TimerState.IDLE]:
-                # Use standard Pause icon for paused
-                icon = self.parent_window.style().standardIcon(QtWidgets.QStyle.SP_MediaPause)
-            else:  # STOPPED
-                # Use standard Stop icon for stopped
-                icon = self.parent_window.style().standardIcon(QtWidgets.QStyle.SP_MediaStop)
-
-            self.setIcon(icon)
+            count = self._get_unsynced()
         except Exception as e:
-            print(f"Error setting icon for state: {e}")
+            self.logger.error("Error getting unsynced task count: %s", e)
+            return 0
+
+        self._unsynced_cache = (now, count)
+        return count
+
+    @QtCore.pyqtSlot()
+    def invalidate_unsynced_count(self):
+        """
+        Forget the cached unsynced task count so the next update looks it up.
+        """
+        self._unsynced_cache = (0.0, 0)
+
+    def _set_icon_for_state(self, state):
+        """
+        Set the system tray icon based on the current timer state.
+        The icons are resolved once in __init__.
+        """
+        self.setIcon(self._STATE_ICON_CACHE.get(state) or _solid_icon((128, 128, 128)))
 
     def show_message(self, title, message, icon=QtWidgets.QSystemTrayIcon.Information, duration=5000):
         """
@@ -309,16 +477,22 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
             icon (QSystemTrayIcon.MessageIcon): Icon type to show
             duration (int): Duration in milliseconds to show the message
         """
-        self.logger.info(f"Showing system tray notification: {title} - {message}")
-
-        # Check if we support notifications
-        if not self.supportsMessages():
-            self.logger.warning("System does not support tray notifications")
+        # Nothing to do if notifications aren't supported
+        if not self._supports_messages:
             return False
 
+        self.logger.info("Showing system tray notification: %s - %s", title, message)
+
         self.showMessage(title, message, icon, duration)
         return True
 
+    @QtCore.pyqtSlot()
+    def _on_quit_triggered(self):
+        """
+        Handle the Quit menu action.
+        """
+        self._quit_application(self._callbacks['quit'])
+
     def _quit_application(self, quit_func):
         """
         Properly quit the application from the system tray.
@@ -333,7 +507,7 @@ class SystemTrayIcon(QtWidgets.QSystemTrayIcon):
             if quit_func and callable(quit_func):
                 quit_func()
         except Exception as e:
-            self.logger.error(f"Error in quit function: {e}")
+            self.logger.error("Error in quit function: %s", e)
 
         # Ensure application truly quits
         app = QtWidgets.QApplication.instance()
@@ -1,7 +1,5 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
-from src.utils.logger import AppLogger
-from src.utils.path_utils import get_project_root
-import os
+from src.utils.logger import get_logger
 
 
 class TaskDialog(QtWidgets.QDialog):
@@ -12,6 +10,9 @@ class TaskDialog(QtWidgets.QDialog):
     when starting a new productivity tracking session.
     """
 
+    # Up to this many tags are shown in a plain grid, more get a scroll area
+    MAX_GRID_CATEGORIES = 12
+
     def __init__(self, parent=None):
         """
         Initialize the task dialog.
@@ -22,8 +23,7 @@ class TaskDialog(QtWidgets.QDialog):
         super().__init__(parent)
 
         # Initialize logger
-        log_dir = os.path.join(get_project_root(), 'logs')
-        self.logger = AppLogger(log_dir)
+        self.logger = get_logger()
         self.logger.debug("Initializing task entry dialog")
 
         self.setWindowTitle("New Task")
@@ -67,44 +67,60 @@ class TaskDialog(QtWidgets.QDialog):
         self.description_input.setPlaceholderText("Optional: Enter additional details about this task")
         form_layout.addRow("Description (optional):", self.description_input)
 
-        # Create a scroll area for checkboxes to support many tags
-        self.category_frame = QtWidgets.QFrame()
-        self.category_frame.setMaximumHeight(120)
-        self.category_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-
-        # Container widget for checkboxes
-        checkbox_container = QtWidgets.QWidget()
-        self.category_layout = QtWidgets.QVBoxLayout(checkbox_container)
-
         # These should be fetched from somewhere, but for now we'll hardcode
         self.categories = ["Chill", "Gaming", "Leetcode", "Personal Project", "School", "Self-learning", "Other", "None"]
         self.category_checkboxes = {}
 
+        # Checked tags, kept up to date as the checkboxes are toggled
+        self._selected_categories = set()
+        self._category_order = {category: i for i, category in enumerate(self.categories)}
+
         # Idle Detection checkbox
         self.disable_idle_checkbox = QtWidgets.QCheckBox("Disable Idle Detection")
         self.disable_idle_checkbox.setToolTip(
             "Check this if you don't want the timer to pause when you're inactive (e.g., watching videos)")
         layout.addWidget(self.disable_idle_checkbox)
 
-        for category in self.categories:
-            checkbox = QtWidgets.QCheckBox(category)
-            self.category_layout.addWidget(checkbox)
-            self.category_checkboxes[category] = checkbox
+        if len(self.categories) <= self.MAX_GRID_CATEGORIES:
+            # A short list fits in a two-column grid directly on the form
+            self.category_frame = None
+            self.category_layout = QtWidgets.QGridLayout()
+            for i, category in enumerate(self.categories):
+                self.category_layout.addWidget(self._create_category_checkbox(category), i // 2, i % 2)
 
-        # Add a bit of spacing at the bottom
-        self.category_layout.addStretch()
-
-        # Set up the scroll area
-        scroll_area.setWidget(checkbox_container)
-        scroll_layout = QtWidgets.QVBoxLayout(self.category_frame)
-        scroll_layout.addWidget(scroll_area)
-        scroll_layout.setContentsMargins(0, 0, 0, 0)
-
-        form_layout.addRow("Tags (select multiple):", self.category_frame)
+            form_layout.addRow("Tags (select multiple):", self.category_layout)
+        else:
+            # Not reached with the hardcoded tags above. Kept for when the tag
+            # list is loaded from settings and can grow past the grid limit.
+            # Create a scroll area for checkboxes to support many tags
+            self.category_frame = QtWidgets.QFrame()
+            self.category_frame.setMaximumHeight(120)
+            self.category_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+
+            scroll_area = QtWidgets.QScrollArea()
+            scroll_area.setWidgetResizable(True)
+            scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+
+            # Container widget for checkboxes
+            checkbox_container = QtWidgets.QWidget()
+            self.category_layout = QtWidgets.QVBoxLayout(checkbox_container)
+
+            # Add all checkboxes before the container repaints or relays out
+            checkbox_container.setUpdatesEnabled(False)
+            for category in self.categories:
+                self.category_layout.addWidget(self._create_category_checkbox(category))
+
+            # Add a bit of spacing at the bottom
+            self.category_layout.addStretch()
+            checkbox_container.setUpdatesEnabled(True)
+
+            # Set up the scroll area
+            scroll_area.setWidget(checkbox_container)
+            scroll_layout = QtWidgets.QVBoxLayout(self.category_frame)
+            scroll_layout.addWidget(scroll_area)
+            scroll_layout.setContentsMargins(0, 0, 0, 0)
+
+            form_layout.addRow("Tags (select multiple):", self.category_frame)
 
         # Add form to main layout
         layout.addLayout(form_layout)
@@ -156,6 +172,44 @@ class TaskDialog(QtWidgets.QDialog):
 
         self.logger.debug("Task dialog UI setup complete")
 
+    def _create_category_checkbox(self, category):
+        """
+        Create the checkbox for a tag and track its checked state.
+
+        Args:
+            category (str): Tag shown on the checkbox
+
+        Returns:
+            QCheckBox: The new checkbox
+        """
+        checkbox = QtWidgets.QCheckBox(category)
+        checkbox.toggled.connect(lambda checked, c=category: self._on_category_toggled(c, checked))
+        self.category_checkboxes[category] = checkbox
+        return checkbox
+
+    def _on_category_toggled(self, category, checked):
+        """
+        Add or remove a tag from the selected set.
+
+        Args:
+            category (str): Tag that was toggled
+            checked (bool): New checked state
+        """
+        if checked:
+            self._selected_categories.add(category)
+        else:
+            self._selected_categories.discard(category)
+
+    def _get_selected_categories(self):
+        """
+        Get the checked tags in the order they are listed.
+
+        Returns:
+            list: Selected tag names
+        """
+        return sorted(self._selected_categories, key=self._category_order.__getitem__)
+
+    @QtCore.pyqtSlot()
     def validate_input(self):
         """
         Validate the input fields and update UI feedback.
@@ -170,6 +224,7 @@ class TaskDialog(QtWidgets.QDialog):
             self.feedback_label.setVisible(False)
             self.button_box.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(True)
 
+    @QtCore.pyqtSlot()
     def validate_and_accept(self):
         """
         Validate input before accepting the dialog.
@@ -182,11 +237,7 @@ class TaskDialog(QtWidgets.QDialog):
             self.feedback_label.setVisible(True)
             return
 
-        # Get selected categories for logging
-        selected_categories = [cat for cat, checkbox in self.category_checkboxes.items()
-                               if checkbox.isChecked()]
-
-        self.logger.info(f"New task created: '{task_name}' with tags: {selected_categories}")
+        self.logger.info("New task created: '%s' with tags: %s", task_name, self._get_selected_categories())
         self.accept()
 
     def get_task_info(self):
@@ -200,8 +251,7 @@ class TaskDialog(QtWidgets.QDialog):
         description = self.description_input.toPlainText().strip()
 
         # Get selected categories
-        selected_categories = [cat for cat, checkbox in self.category_checkboxes.items()
-                               if checkbox.isChecked()]
+        selected_categories = self._get_selected_categories()
 
         # Get idle detection setting
         disable_idle_detection = self.disable_idle_checkbox.isChecked()
@@ -214,6 +264,24 @@ class TaskDialog(QtWidgets.QDialog):
 
         return task_name, description, selected_categories, disable_idle_detection
 
+    def reset(self):
+        """
+        Clear all inputs so the dialog can be reused for a new task.
+        """
+        self.logger.debug("Resetting task dialog")
+
+        self.task_name_input.clear()
+        self.description_input.clear()
+        for checkbox in self.category_checkboxes.values():
+            checkbox.setChecked(False)
+        self.disable_idle_checkbox.setChecked(False)
+
+        # Clearing the name triggers validation, restore the initial state
+        self.feedback_label.setVisible(False)
+        self.button_box.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(True)
+
+        self.task_name_input.setFocus()
+
     def closeEvent(self, event):
         """
         Handle dialog close event.
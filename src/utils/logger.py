@@ -1,6 +1,13 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
+from src.utils.path_utils import get_project_root
+
+# Shared AppLogger returned by get_logger
+_INSTANCE = None
 
 
 class AppLogger:
@@ -10,6 +17,9 @@ class AppLogger:
     # Class variable to track if logger is already configured
     _loggers = {}
 
+    # Background listener that writes queued records to the log file
+    _listener = None
+
     def __init__(self, log_dir, log_level=logging.INFO):
         """
         Initialize the logger with the directory for log files.
@@ -18,6 +28,14 @@ class AppLogger:
             log_dir (str): Directory where log files will be stored
             log_level (int): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
+        # Configure logger
+        logger_name = "ProductivityTracker"
+
+        # Reuse an already configured logger, no file setup needed
+        if logger_name in self._loggers:
+            self.logger = self._loggers[logger_name]
+            return
+
         # Create log directory if it doesn't exist
         os.makedirs(log_dir, exist_ok=True)
 
@@ -25,51 +43,93 @@ class AppLogger:
         current_date = datetime.now().strftime("%Y-%m-%d")
         log_file = os.path.join(log_dir, f"app_{current_date}.log")
 
-        # Configure logger
-        logger_name = "ProductivityTracker"
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(log_level)
 
-        # Check if logger already exists to prevent duplicate handlers
-        if logger_name in self._loggers:
-            self.logger = self._loggers[logger_name]
-        else:
-            self.logger = logging.getLogger(logger_name)
-            self.logger.setLevel(log_level)
-
-            # Only add handler if it doesn't already have handlers
-            if not self.logger.handlers:
-                # Create file handler for writing to log file
-                file_handler = logging.FileHandler(log_file)
-                file_handler.setLevel(log_level)
-
-                # Create formatter for log messages
-                formatter = logging.Formatter(
-                    '%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S'
-                )
-                file_handler.setFormatter(formatter)
-
-                # Add the handler to the logger
-                self.logger.addHandler(file_handler)
-
-            # Save in class variable to prevent duplicate handlers
-            self._loggers[logger_name] = self.logger
-
-    def debug(self, message):
+        # Only add handler if it doesn't already have handlers
+        if not self.logger.handlers:
+            # Create file handler for writing to log file
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setLevel(log_level)
+
+            # Create formatter for log messages
+            formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            file_handler.setFormatter(formatter)
+
+            # Log calls only enqueue the record, a listener thread writes the file
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            AppLogger._listener = logging.handlers.QueueListener(log_queue, file_handler)
+            AppLogger._listener.start()
+
+            # Write out anything still queued when the process exits
+            atexit.register(AppLogger.shutdown)
+
+        # Save in class variable to prevent duplicate handlers
+        self._loggers[logger_name] = self.logger
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Stop the background listener after writing out any queued records.
+        """
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+
+    def is_enabled_for(self, level):
+        """
+        Check whether messages at the given level would be logged.
+
+        Args:
+            level (int): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+        Returns:
+            bool: True if the level is enabled
+        """
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, *args):
         """Log a debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log an informational message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log a warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log an error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
+
+    def exception(self, message, *args):
+        """Log an error message along with the current exception's traceback."""
+        self.logger.exception(message, *args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log a critical error message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+
+
+def get_logger(log_dir=None):
+    """
+    Get the shared application logger, creating it on first use.
+
+    Args:
+        log_dir (str, optional): Directory for log files, defaults to the project's logs folder
+
+    Returns:
+        AppLogger: The shared logger
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        if log_dir is None:
+            log_dir = os.path.join(get_project_root(), 'logs')
+        _INSTANCE = AppLogger(log_dir)
+    return _INSTANCE
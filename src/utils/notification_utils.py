@@ -2,18 +2,198 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 import sys
 import platform
 import logging
+import queue
+import subprocess
+import threading
+import time
+from xml.sax.saxutils import escape
 
 # Configure a logger for this module
 logger = logging.getLogger("ProductivityTracker.notifications")
 
+# AppUserModelID the Windows toasts are shown under, see register_app_id
+_APP_ID = "NicholasLawhon.ProductivityTracker"
+
+# Name shown on Windows toasts and on merged notifications
+_APP_NAME = "Productivity Tracker"
+
+# Per-user registry key that makes _APP_ID known to Windows for an unpackaged exe
+_APP_ID_KEY = "Software\\Classes\\AppUserModelId\\" + _APP_ID
+
+# Set once register_app_id succeeds, Windows drops WinRT toasts before that
+_app_id_registered = False
+
+# Toast layout for Windows notifications, filled in with the title and message
+_TOAST_XML = (
+    "<toast><visual><binding template='ToastGeneric'>"
+    "<text>{}</text><text>{}</text>"
+    "</binding></visual></toast>"
+)
+
+# Windows toast notifier, created on first use
+_toast_notifier = None
+
+# Session bus connection for Linux notifications, opened on first use
+_dbus_connection = None
+
+# Platform notifications arriving within this many seconds are shown as one
+_COALESCE_WINDOW = 0.25
+
+# Queue feeding the platform notification thread, created on first use
+_notify_queue = None
+_notify_lock = threading.Lock()
+
+
+class _NotificationDispatcher(QtCore.QObject):
+    """
+    Forwards notification requests from worker threads to the GUI thread.
+
+    Qt widgets, including the system tray, may only be used from the GUI
+    thread, so requests made elsewhere are re-emitted through a queued signal.
+    """
+
+    requested = QtCore.pyqtSignal(str, str, object, int)
+
+    def __init__(self):
+        super().__init__()
+        self.requested.connect(self._show)
+
+    @QtCore.pyqtSlot(str, str, object, int)
+    def _show(self, title, message, icon_type, duration):
+        show_notification(title, message, icon_type, duration)
+
+
+_dispatcher = None
+
+
+def _get_dispatcher(app):
+    """
+    Get the notification dispatcher, creating it in the GUI thread if needed.
+
+    Args:
+        app (QApplication): The application instance
+
+    Returns:
+        _NotificationDispatcher: The dispatcher living in the GUI thread
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = _NotificationDispatcher()
+        _dispatcher.moveToThread(app.thread())
+    return _dispatcher
+
+
+class NotificationManager(QtCore.QObject):
+    """
+    Shows system tray notifications for the application.
+
+    One manager is created at startup and found by show_notification. It
+    uses the application's own tray icon once one is attached, otherwise a
+    fallback tray icon that is created, with its icon, on first use. Where
+    the desktop has no system tray it uses the platform's notifications.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize the notification manager and make it the active one.
+
+        Args:
+            parent: Parent QObject, usually the main window
+        """
+        super().__init__(parent)
+        self._tray = None
+        self._fallback_tray = None
+
+        global _manager
+        _manager = self
+
+    def set_tray(self, tray):
+        """
+        Use the application's system tray icon for notifications.
+
+        Args:
+            tray (SystemTrayIcon): The tray icon, or None to go back to the fallback
+        """
+        self._tray = tray
+
+    def show(self, title, message, icon_type=QtWidgets.QSystemTrayIcon.Information, duration=5000):
+        """
+        Show a notification through the system tray.
+
+        Args:
+            title (str): Notification title
+            message (str): Notification message
+            icon_type (QSystemTrayIcon.MessageIcon): Icon type to show
+            duration (int): Duration in milliseconds to show the message
+
+        Returns:
+            bool: True if notification was shown, False otherwise
+        """
+        # Without a system tray, use the platform's own notifications
+        if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
+            return show_platform_notification(title, message)
+
+        if self._tray is not None:
+            # Use the application's existing system tray icon
+            return self._tray.show_message(title, message, icon_type, duration)
+
+        tray = self._get_fallback_tray()
+        tray.show()
+        tray.showMessage(title, message, icon_type, duration)
+        return True
+
+    def _get_fallback_tray(self):
+        """
+        Get the tray icon used when the application has none, creating it once.
+
+        Returns:
+            QSystemTrayIcon: The fallback tray icon
+        """
+        if self._fallback_tray is None:
+            self._fallback_tray = QtWidgets.QSystemTrayIcon(self)
+
+            # Set an appropriate icon
+            parent = self.parent()
+            if isinstance(parent, QtWidgets.QWidget) and not parent.windowIcon().isNull():
+                self._fallback_tray.setIcon(parent.windowIcon())
+            else:
+                # Use a standard icon if no application icon is available
+                self._fallback_tray.setIcon(_default_icon())
+        return self._fallback_tray
+
+
+# The active notification manager, set when one is created
+_manager = None
+
+# Icon for notification tray icons without an app icon, resolved on first use
+_ICON = None
+
+
+def _default_icon():
+    """
+    Get the information icon for notifications, resolving it once.
+
+    Returns:
+        QIcon: The theme's information icon, or the style's if the theme has none
+    """
+    global _ICON
+    if _ICON is None:
+        icon = QtGui.QIcon.fromTheme("dialog-information")
+        if icon.isNull():
+            # Fallback icon
+            icon = QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation)
+        _ICON = icon
+    return _ICON
+
 
 def show_notification(title, message, icon_type=QtWidgets.QSystemTrayIcon.Information, duration=5000):
     """
     Show a system notification.
 
-    This function attempts to show a notification using the system tray.
-    If a system tray already exists in the app, it will use that.
-    Otherwise, it creates a temporary one.
+    This function shows the notification through the active
+    NotificationManager, which uses the app's system tray if it has one and
+    the platform's notifications if the desktop has no tray. A manager is
+    created on first use if the app hasn't made one.
 
     Args:
         title (str): Notification title
@@ -24,12 +204,6 @@ def show_notification(title, message, icon_type=QtWidgets.QSystemTrayIcon.Inform
     Returns:
         bool: True if notification was shown, False otherwise
     """
-    # Check if system supports notifications
-    if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
-        logger.warning("System tray not available, cannot show notification")
-        return False
-
-    # If we have access to system notifications
     try:
         # Get application instance
         app = QtWidgets.QApplication.instance()
@@ -38,47 +212,180 @@ def show_notification(title, message, icon_type=QtWidgets.QSystemTrayIcon.Inform
             logger.warning("No QApplication instance, cannot show notification")
             return False
 
-        # Try to find an existing system tray icon in the app
-        main_window = app.activeWindow()
-        if main_window and hasattr(main_window, 'system_tray'):
-            # Use the application's existing system tray icon
-            main_window.system_tray.show_message(title, message, icon_type, duration)
+        # Widgets can't be touched from worker threads, hand off to the GUI thread
+        if QtCore.QThread.currentThread() is not app.thread():
+            _get_dispatcher(app).requested.emit(title, message, icon_type, duration)
             return True
 
-        # Create system tray icon if needed (temporary one if no existing)
-        if not hasattr(show_notification, 'tray_icon'):
-            show_notification.tray_icon = QtWidgets.QSystemTrayIcon()
-
-            # Set an appropriate icon
-            if hasattr(main_window, 'windowIcon') and not main_window.windowIcon().isNull():
-                show_notification.tray_icon.setIcon(main_window.windowIcon())
-            else:
-                # Use a standard icon if no application icon is available
-                icon = QtGui.QIcon.fromTheme("dialog-information")
-                if icon.isNull():
-                    # Fallback icon
-                    icon = QtWidgets.QStyle.standardIcon(
-                        QtWidgets.QApplication.style(),
-                        QtWidgets.QStyle.SP_MessageBoxInformation
-                    )
-                show_notification.tray_icon.setIcon(icon)
-
-        # Show notification
-        show_notification.tray_icon.show()
-        show_notification.tray_icon.showMessage(
-            title, message, icon_type, duration
-        )
-        return True
+        manager = _manager if _manager is not None else NotificationManager()
+        return manager.show(title, message, icon_type, duration)
 
     except Exception as e:
-        logger.error(f"Could not show notification: {e}")
+        logger.error("Could not show notification: %s", e)
+        return False
+
+
+def register_app_id():
+    """
+    Register the app's AppUserModelID with Windows and use it for this process.
+
+    Windows silently drops WinRT toasts from an unpackaged app whose ID it
+    doesn't know, so native toasts are only used once this has succeeded.
+    Call it once at startup, before any window is shown.
+
+    Returns:
+        bool: True if the ID was registered, False otherwise
+    """
+    global _app_id_registered
+    if platform.system() != "Windows":
         return False
 
+    try:
+        import ctypes
+        import winreg
+
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, _APP_ID_KEY) as key:
+            winreg.SetValueEx(key, "DisplayName", 0, winreg.REG_SZ, _APP_NAME)
+
+        result = ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(_APP_ID)
+        if result != 0:
+            raise OSError(f"SetCurrentProcessExplicitAppUserModelID failed with HRESULT {result:#x}")
+    except (OSError, AttributeError) as e:
+        logger.warning("Could not register app ID %s, using win10toast: %s", _APP_ID, e)
+        return False
+
+    _app_id_registered = True
+    return True
+
+
+def _show_winrt_toast(title, message):
+    """
+    Show a native Windows toast through WinRT (requires the winsdk package).
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Raises:
+        ImportError: If winsdk is not installed
+    """
+    global _toast_notifier
+    from winsdk.windows.ui.notifications import ToastNotificationManager, ToastNotification
+    from winsdk.windows.data.xml.dom import XmlDocument
+
+    if _toast_notifier is None:
+        _toast_notifier = ToastNotificationManager.create_toast_notifier(_APP_ID)
+
+    doc = XmlDocument()
+    doc.load_xml(_TOAST_XML.format(escape(title), escape(message)))
+    _toast_notifier.show(ToastNotification(doc))
+
+
+def _get_notify_queue():
+    """
+    Get the platform notification queue, starting its thread if needed.
+
+    Returns:
+        queue.Queue: Queue of (title, message) tuples
+    """
+    global _notify_queue
+    with _notify_lock:
+        if _notify_queue is None:
+            _notify_queue = queue.Queue()
+            threading.Thread(target=_notification_loop, args=(_notify_queue,),
+                             name="PlatformNotifications", daemon=True).start()
+    return _notify_queue
+
+
+def _notification_loop(requests):
+    """
+    Show queued platform notifications, merging bursts into one.
+
+    Args:
+        requests (queue.Queue): Queue of (title, message) tuples
+    """
+    while True:
+        batch = [requests.get()]
+
+        # Collect whatever else arrives shortly after the first request
+        deadline = time.monotonic() + _COALESCE_WINDOW
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        title, message = batch[0]
+        if len(batch) > 1:
+            if all(t == title for t, _ in batch):
+                message = "\n".join(m for _, m in batch)
+            else:
+                message = "\n".join(f"{t}: {m}" for t, m in batch)
+                title = _APP_NAME
+
+        _show_platform_notification_now(title, message)
+
+
+def _send_dbus_notification(title, message):
+    """
+    Send a desktop notification straight over the D-Bus session bus (requires jeepney).
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Raises:
+        ImportError: If jeepney is not installed
+    """
+    global _dbus_connection
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+
+    if _dbus_connection is None:
+        _dbus_connection = open_dbus_connection(bus='SESSION')
+
+    address = DBusAddress('/org/freedesktop/Notifications',
+                          bus_name='org.freedesktop.Notifications',
+                          interface='org.freedesktop.Notifications')
+    # Notify(app_name, replaces_id, app_icon, summary, body, actions, hints, expire_timeout)
+    try:
+        _dbus_connection.send_and_get_reply(new_method_call(
+            address, 'Notify', 'susssasa{sv}i',
+            ("ProductivityTracker", 0, "", title, message, [], {}, 5000)
+        ))
+    except Exception:
+        # Reconnect on the next notification
+        _dbus_connection.close()
+        _dbus_connection = None
+        raise
+
 
 def show_platform_notification(title, message):
     """
     Show a notification using platform-specific methods.
-    Useful as a fallback when Qt system tray notifications aren't available.
+    Used by NotificationManager when the desktop has no system tray.
+
+    The notification is shown from a background thread so the caller never
+    waits on process creation or the Windows toast APIs. Requests made within
+    a quarter second of each other are merged into a single notification.
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Returns:
+        bool: True once the notification has been queued
+    """
+    _get_notify_queue().put((title, message))
+    return True
+
+
+def _notify_windows(title, message):
+    """
+    Show a Windows toast notification.
 
     Args:
         title (str): Notification title
@@ -87,54 +394,137 @@ def show_platform_notification(title, message):
     Returns:
         bool: True if notification was shown, False otherwise
     """
+    # Use native Windows toast notifications once the app ID is registered (requires winsdk package)
+    if _app_id_registered:
+        try:
+            _show_winrt_toast(title, message)
+            return True
+        except ImportError:
+            logger.warning("winsdk package not installed, trying win10toast")
+
+    # Older toast notifications (requires win10toast package)
     try:
-        system = platform.system()
+        from win10toast import ToastNotifier
+        toaster = ToastNotifier()
+        toaster.show_toast(title, message, duration=5, threaded=False)
+        return True
+    except ImportError:
+        logger.warning("win10toast package not installed, falling back to system tray")
+        return _notify_tray(title, message)
+
+
+def _notify_macos(title, message):
+    """
+    Show a macOS notification (requires terminal-notifier).
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Returns:
+        bool: True if notification was shown, False otherwise
+    """
+    try:
+        subprocess.Popen([
+            'terminal-notifier',
+            '-title', title,
+            '-message', message,
+            '-sound', 'default'
+        ])
+        return True
+    except (FileNotFoundError, subprocess.SubprocessError):
+        logger.warning("terminal-notifier not installed, falling back to system tray")
+        return _notify_tray(title, message)
 
-        if system == "Windows":
-            # Use Windows toast notifications (requires win10toast package)
-            try:
-                from win10toast import ToastNotifier
-                toaster = ToastNotifier()
-                toaster.show_toast(title, message, duration=5, threaded=True)
-                return True
-            except ImportError:
-                logger.warning("win10toast package not installed, falling back to system tray")
-                return show_notification(title, message)
-
-        elif system == "Darwin":  # macOS
-            # Use macOS notifications (requires terminal-notifier)
-            import subprocess
-            try:
-                subprocess.Popen([
-                    'terminal-notifier',
-                    '-title', title,
-                    '-message', message,
-                    '-sound', 'default'
-                ])
-                return True
-            except (FileNotFoundError, subprocess.SubprocessError):
-                logger.warning("terminal-notifier not installed, falling back to system tray")
-                return show_notification(title, message)
-
-        elif system == "Linux":
-            # Use Linux notifications (requires notify-send)
-            import subprocess
-            try:
-                subprocess.Popen([
-                    'notify-send',
-                    title,
-                    message
-                ])
-                return True
-            except (FileNotFoundError, subprocess.SubprocessError):
-                logger.warning("notify-send not installed, falling back to system tray")
-                return show_notification(title, message)
-
-        else:
-            # Unknown platform, fall back to system tray
-            logger.warning(f"Unknown platform {system}, falling back to system tray")
-            return show_notification(title, message)
 
+def _notify_linux(title, message):
+    """
+    Show a Linux desktop notification.
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Returns:
+        bool: True if notification was shown, False otherwise
+    """
+    # Talk to the notification daemon directly (requires jeepney package)
+    try:
+        _send_dbus_notification(title, message)
+        return True
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning("D-Bus notification failed, trying notify-send: %s", e)
+
+    # Spawn notify-send instead (requires notify-send)
+    try:
+        subprocess.Popen([
+            'notify-send',
+            title,
+            message
+        ])
+        return True
+    except (FileNotFoundError, subprocess.SubprocessError):
+        logger.warning("notify-send not installed, falling back to system tray")
+        return _notify_tray(title, message)
+
+
+def _notify_tray(title, message):
+    """
+    Show a notification through the system tray when no platform method works.
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Returns:
+        bool: True if notification was shown, False otherwise
+    """
+    # The manager sends notifications here when there is no tray, don't send them back
+    if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
+        logger.warning("System tray not available, cannot show notification")
+        return False
+    return show_notification(title, message)
+
+
+def _pick_notifier():
+    """
+    Choose the notification handler for the platform we're running on.
+
+    Returns:
+        callable: Handler taking (title, message)
+    """
+    system = platform.system()
+    if system == "Windows":
+        return _notify_windows
+    if system == "Darwin":  # macOS
+        return _notify_macos
+    if system == "Linux":
+        return _notify_linux
+
+    # Unknown platform, fall back to system tray
+    logger.warning("Unknown platform %s, falling back to system tray", system)
+    return _notify_tray
+
+
+# Platform notification handler, resolved once at import
+_NOTIFIER = _pick_notifier()
+
+
+def _show_platform_notification_now(title, message):
+    """
+    Show a notification using platform-specific methods on the calling thread.
+
+    Args:
+        title (str): Notification title
+        message (str): Notification message
+
+    Returns:
+        bool: True if notification was shown, False otherwise
+    """
+    try:
+        return _NOTIFIER(title, message)
     except Exception as e:
-        logger.error(f"Error showing platform notification: {e}")
-        return show_notification(title, message)  # Fall back to system tray
+        logger.error("Error showing platform notification: %s", e)
+        return _notify_tray(title, message)  # Fall back to system tray
@@ -1,33 +1,97 @@
 # src/utils/path_utils.py
+import atexit
 import os
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import datetime
+import tempfile
+import threading
 
+# User home and the app folders under it, resolved once at import
+_HOME = os.path.expanduser("~")
+_DEBUG_DIR = os.path.join(_HOME, "ProductivityTracker_Debug")
+_APP_DIR = os.path.join(_HOME, "ProductivityTracker")
 
-def debug_print(message, also_file=True):
+# Subdirectories every project root needs
+_SUBDIRS = ('data', 'logs', 'credentials', 'resources')
+
+# Directories already created or confirmed by _ensure_dir in this process
+_ENSURED = set()
+
+# Resolved by the first successful get_project_root() call
+_PROJECT_ROOT = None
+
+# Buffered debug.log handle shared by debug_print, opened on first use
+_debug_fh = None
+_debug_writes = 0
+
+# Flush the debug file after this many messages, warnings and errors are flushed at once
+_DEBUG_FLUSH_EVERY = 100
+
+
+def _ensure_dir(path):
+    """
+    Create a directory if needed, at most once per process for each path.
+
+    Args:
+        path (str): Directory to create
+    """
+    if path not in _ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED.add(path)
+
+
+def _get_debug_file():
+    """
+    Get the debug log file handle, opening it once for appending.
+
+    Returns:
+        file: The open debug.log file
+    """
+    global _debug_fh
+    if _debug_fh is None:
+        # Use user's home directory to ensure it's writable
+        _ensure_dir(_DEBUG_DIR)
+
+        _debug_fh = open(os.path.join(_DEBUG_DIR, "debug.log"), "a", buffering=8192)
+        atexit.register(_debug_fh.close)
+    return _debug_fh
+
+
+def _flush_debug_file():
+    """Write out buffered debug.log messages, if the file has been opened."""
+    if _debug_fh is not None:
+        try:
+            _debug_fh.flush()
+        except Exception as e:
+            print(f"Error flushing debug file: {e}")
+
+
+def debug_print(message, also_file=True, flush=False):
     """
     Print debug message to console and optionally to a debug file.
 
     Args:
         message (str): The message to print
         also_file (bool): Whether to also write to a debug file
+        flush (bool): Write the file out now, for warnings and errors that
+            must survive a crash
     """
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+    global _debug_writes
+    timestamp = datetime.datetime.now().isoformat(sep=" ", timespec="microseconds")
     formatted_msg = f"[{timestamp}] {message}"
 
     # Print to console
     print(formatted_msg)
 
-    # Also write to file if requested
+    # Also write to file if requested, buffered and flushed every few messages
     if also_file:
         try:
-            # Use user's home directory to ensure it's writable
-            debug_dir = os.path.join(os.path.expanduser("~"), "ProductivityTracker_Debug")
-            os.makedirs(debug_dir, exist_ok=True)
-
-            debug_file = os.path.join(debug_dir, "debug.log")
-            with open(debug_file, "a") as f:
-                f.write(formatted_msg + "\n")
+            debug_file = _get_debug_file()
+            debug_file.write(formatted_msg + "\n")
+            _debug_writes += 1
+            if flush or _debug_writes % _DEBUG_FLUSH_EVERY == 0:
+                debug_file.flush()
         except Exception as e:
             print(f"Error writing to debug file: {e}")
 
@@ -46,79 +110,140 @@ def log_system_info():
     # Try to create test files in different locations
     locations = [
         ("Current directory", "."),
-        ("Home directory", os.path.expanduser("~")),
-        ("Temp directory", os.path.join(os.path.expanduser("~"), "temp")),
+        ("Home directory", _HOME),
+        ("Temp directory", os.path.join(_HOME, "temp")),
         ("Executable directory", os.path.dirname(sys.executable))
     ]
 
-    for name, path in locations:
-        try:
-            os.makedirs(path, exist_ok=True)
-            test_file = os.path.join(path, "productivity_test.txt")
-            with open(test_file, "w") as f:
-                f.write(f"Test file created at {datetime.datetime.now()}")
-            debug_print(f"Successfully wrote to {name}: {test_file}")
-        except Exception as e:
-            debug_print(f"Failed to write to {name}: {e}")
+    # Write to all locations at once, slow disks then cost the slowest write rather than the sum
+    with ThreadPoolExecutor(max_workers=len(locations)) as executor:
+        results = list(executor.map(_try_write, locations))
 
-    debug_print("=== END SYSTEM INFO ===")
+    for ok, result in results:
+        debug_print(result, flush=not ok)
 
+    # Startup output is far below the flush interval, write it out before the app runs
+    debug_print("=== END SYSTEM INFO ===", flush=True)
 
-def get_project_root():
+
+def _try_write(location):
     """
-    Returns the absolute path to the project root directory.
-    In development: Uses the actual project directory
-    When packaged: Uses ~/ProductivityTracker
+    Try to create a test file in a location.
+
+    Args:
+        location (tuple): (name, path) of the location to test
+
+    Returns:
+        tuple: (succeeded, message describing the outcome)
     """
+    name, path = location
     try:
-        # Check if we're running in the development environment
-        # by looking for common project structure indicators
-        current_dir = os.path.dirname(os.path.abspath(__file__))
+        _ensure_dir(path)
+        test_file = os.path.join(path, "productivity_test.txt")
+        with open(test_file, "w") as f:
+            f.write(f"Test file created at {datetime.datetime.now()}")
+        return True, f"Successfully wrote to {name}: {test_file}"
+    except Exception as e:
+        return False, f"Failed to write to {name}: {e}"
 
-        # Go up one level (from src/utils to src)
-        parent_dir = os.path.dirname(current_dir)
 
-        # Go up one more level (from src to project root)
-        potential_project_root = os.path.dirname(parent_dir)
+def _packaged_project_root():
+    """
+    Set up and return the app directory in the user's home folder.
 
-        # Check if we're in development environment by looking for common files/directories
-        dev_indicators = [
-            os.path.isdir(os.path.join(potential_project_root, 'src')),
-            os.path.isdir(os.path.join(potential_project_root, '.git')),
-            os.path.isdir(os.path.join(potential_project_root, '.idea')),
-            os.path.isfile(os.path.join(potential_project_root, 'main.py')),
-            os.path.isfile(os.path.join(potential_project_root, 'Requirements.txt'))
-        ]
+    Returns:
+        str: ~/ProductivityTracker
+    """
+    app_dir = _APP_DIR
+    print(f"Using application directory in home folder: {app_dir}")
 
-        # If at least 2 development indicators are found, we're likely in dev mode
-        if sum(dev_indicators) >= 2:
-            print(f"Development environment detected, using project directory: {potential_project_root}")
+    # Create the directory and subdirectories if they don't exist
+    _ensure_dir(app_dir)
+    for subdir in _SUBDIRS:
+        _ensure_dir(os.path.join(app_dir, subdir))
 
-            # Ensure the required directories exist
-            for subdir in ['data', 'logs', 'credentials', 'resources']:
-                os.makedirs(os.path.join(potential_project_root, subdir), exist_ok=True)
+    return app_dir
 
-            return potential_project_root
 
-        # If we're not in development, use the home directory approach for packaged app
-        app_dir = os.path.join(os.path.expanduser("~"), "ProductivityTracker")
-        print(f"Using application directory in home folder: {app_dir}")
+def _dev_project_root():
+    """
+    Return the source checkout when running from one, else the home app directory.
 
-        # Create the directory and subdirectories if they don't exist
-        os.makedirs(app_dir, exist_ok=True)
-        for subdir in ['data', 'logs', 'credentials', 'resources']:
-            os.makedirs(os.path.join(app_dir, subdir), exist_ok=True)
+    Returns:
+        str: The project root to use
+    """
+    # Check if we're running in the development environment
+    # by looking for common project structure indicators
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Go up one level (from src/utils to src)
+    parent_dir = os.path.dirname(current_dir)
+
+    # Go up one more level (from src to project root)
+    potential_project_root = os.path.dirname(parent_dir)
+
+    # Check if we're in development environment by looking for common files/directories
+    dev_indicators = [
+        os.path.isdir(os.path.join(potential_project_root, 'src')),
+        os.path.isdir(os.path.join(potential_project_root, '.git')),
+        os.path.isdir(os.path.join(potential_project_root, '.idea')),
+        os.path.isfile(os.path.join(potential_project_root, 'main.py')),
+        os.path.isfile(os.path.join(potential_project_root, 'Requirements.txt'))
+    ]
+
+    # If at least 2 development indicators are found, we're likely in dev mode
+    if sum(dev_indicators) >= 2:
+        print(f"Development environment detected, using project directory: {potential_project_root}")
+
+        # Ensure the required directories exist
+        for subdir in _SUBDIRS:
+            _ensure_dir(os.path.join(potential_project_root, subdir))
+
+        return potential_project_root
+
+    # If we're not in development, use the home directory approach for packaged app
+    return _packaged_project_root()
 
-        return app_dir
+
+# A PyInstaller bundle never runs from a source checkout, so skip the probing there
+_find_project_root = _packaged_project_root if getattr(sys, 'frozen', False) else _dev_project_root
+
+
+def get_project_root():
+    """
+    Returns the absolute path to the project root directory.
+    In development: Uses the actual project directory
+    When packaged: Uses ~/ProductivityTracker
+
+    The directory is resolved, and its subdirectories created, once per
+    process; later calls return the cached path.
+    """
+    global _PROJECT_ROOT
+    if _PROJECT_ROOT is not None:
+        return _PROJECT_ROOT
+
+    try:
+        _PROJECT_ROOT = _find_project_root()
+        return _PROJECT_ROOT
 
     except Exception as e:
-        # Print error and fall back to current directory
+        # Print error and fall back to current directory, not cached so a later call can retry
         print(f"Error in get_project_root: {e}")
         import traceback
         print(traceback.format_exc())
         return os.getcwd()
 
 
+# Paths checked by debug_app_paths, relative to the project root
+_DEBUG_PATHS = (
+    ('logs_dir', 'logs'),
+    ('data_dir', 'data'),
+    ('db_file', os.path.join('data', 'local_db.sqlite')),
+    ('credentials_dir', 'credentials'),
+    ('resources_dir', 'resources'),
+)
+
+
 def debug_app_paths():
     """
     Debug function to verify all application paths and write access.
@@ -133,20 +258,26 @@ def debug_app_paths():
     print(f"Current working directory: {os.getcwd()}")
 
     # Test critical directories
-    paths_to_check = {
-        'logs_dir': os.path.join(project_root, 'logs'),
-        'data_dir': os.path.join(project_root, 'data'),
-        'db_file': os.path.join(project_root, 'data', 'local_db.sqlite'),
-        'credentials_dir': os.path.join(project_root, 'credentials'),
-        'resources_dir': os.path.join(project_root, 'resources')
-    }
+    paths_to_check = {name: f"{project_root}{os.sep}{subpath}" for name, subpath in _DEBUG_PATHS}
+
+    # All checked directories sit directly under the project root, list it once
+    try:
+        root_entries = {entry.name: entry for entry in os.scandir(project_root)}
+    except OSError as e:
+        print(f"ERROR listing project root: {e}")
+        root_entries = {}
+
+    def is_existing_dir(dir_path):
+        """Check a project root subdirectory against the listing."""
+        entry = root_entries.get(os.path.basename(dir_path))
+        return entry is not None and entry.is_dir()
 
     for name, path in paths_to_check.items():
         print(f"\nChecking {name}: {path}")
 
         # For directories
         if name.endswith('_dir'):
-            if not os.path.exists(path):
+            if not is_existing_dir(path):
                 print(f"  Directory doesn't exist. Creating...")
                 try:
                     os.makedirs(path, exist_ok=True)
@@ -155,13 +286,11 @@ def debug_app_paths():
                     print(f"  ERROR creating directory: {e}")
                     continue
 
-            # Test write access to directory
-            test_file = os.path.join(path, "write_test.txt")
+            # Test write access to directory, the temporary file is removed on close
             try:
-                with open(test_file, 'w') as f:
+                with tempfile.NamedTemporaryFile('w', dir=path, prefix="write_test") as f:
                     f.write("Test write")
-                print(f"  Successfully wrote to test file: {test_file}")
-                os.remove(test_file)
+                    print(f"  Successfully wrote to test file: {f.name}")
                 print(f"  Successfully removed test file")
             except Exception as e:
                 print(f"  ERROR: Cannot write to directory: {e}")
@@ -171,7 +300,7 @@ def debug_app_paths():
             db_dir = os.path.dirname(path)
 
             # Make sure db directory exists
-            if not os.path.exists(db_dir):
+            if not is_existing_dir(db_dir):
                 try:
                     os.makedirs(db_dir, exist_ok=True)
                     print(f"  Created database directory: {db_dir}")
@@ -182,16 +311,10 @@ def debug_app_paths():
             # Check if db file exists and we can connect to it
             if os.path.exists(path):
                 print(f"  Database file exists")
-                try:
-                    import sqlite3
-                    conn = sqlite3.connect(path)
-                    cursor = conn.cursor()
-                    cursor.execute("PRAGMA integrity_check")
-                    result = cursor.fetchone()
-                    print(f"  Database integrity check: {result}")
-                    conn.close()
-                except Exception as e:
-                    print(f"  ERROR accessing existing database: {e}")
+                # The integrity check reads the whole database, don't hold up startup for it
+                print("  Database integrity check running in the background")
+                threading.Thread(target=_check_database_integrity, args=(path,),
+                                 name="DatabaseIntegrityCheck", daemon=True).start()
             else:
                 print(f"  Database file doesn't exist yet")
                 try:
@@ -207,3 +330,25 @@ def debug_app_paths():
                     print(f"  ERROR creating test database: {e}")
 
     print("\n=== END DEBUG APP PATHS ===\n")
+
+    # Keep anything debug_print buffered during startup if the app dies later
+    _flush_debug_file()
+
+
+def _check_database_integrity(path):
+    """
+    Run SQLite's integrity check on a database and print the result.
+
+    Args:
+        path (str): Path to the database file
+    """
+    try:
+        import sqlite3
+        conn = sqlite3.connect(path)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA integrity_check")
+        result = cursor.fetchone()
+        print(f"Database integrity check for {path}: {result}")
+        conn.close()
+    except Exception as e:
+        print(f"ERROR accessing existing database {path}: {e}")
@@ -1,10 +1,18 @@
-from src.utils.path_utils import get_project_root
-from src.utils.logger import AppLogger
-from datetime import datetime
+from src.utils.logger import get_logger
 from enum import Enum
-import psutil
+import sys
 import time
-import os
+
+# Durations are measured on the monotonic clock, unaffected by wall clock changes
+_monotonic = time.monotonic
+
+# Win32 input APIs for idle detection, only available on Windows with pywin32
+win32api = None
+if sys.platform == 'win32':
+    try:
+        import win32api
+    except ImportError:
+        pass
 
 
 class TimerState(Enum):
@@ -20,6 +28,10 @@ class PauseReason(Enum):
     SYSTEM = 2  # System event (sleep, shutdown)
 
 
+# States in which the timer is stopped but the task can be resumed
+PAUSED_STATES = frozenset((TimerState.PAUSED, TimerState.IDLE))
+
+
 class TimeTracker:
     def __init__(self, task_name="", paused_duration_alert=600, idle_threshold=300):
         self.state = TimerState.STOPPED
@@ -32,10 +44,11 @@ class TimeTracker:
         self.total_idle_time = 0  # In seconds
         self.idle_threshold = idle_threshold  # 5 minutes default idle threshold
         self.paused_duration_alert = paused_duration_alert  # Default alert after 10 minutes of pause
+        self.disable_idle_check = False  # Set per task to skip idle detection
+        self.long_pause_alerted = False  # Long-pause alert already raised for the current pause
 
         # Setup logger
-        log_dir = os.path.join(get_project_root(), 'logs')
-        self.logger = AppLogger(log_dir)
+        self.logger = get_logger()
 
         # Event Callbacks
         self.on_state_change = None  # Function to call when state changes
@@ -43,7 +56,16 @@ class TimeTracker:
         self.on_long_pause = None  # Function to call when paused for too long
 
         # Last activity timestamp (for idle detection)
-        self.last_activity_time = time.time()
+        self.last_activity_time = _monotonic()
+
+        # Look up the Win32 idle functions once instead of on every check
+        if win32api is not None:
+            self._get_last_input_info = win32api.GetLastInputInfo
+            self._get_tick_count = win32api.GetTickCount
+        else:
+            self._get_last_input_info = None
+            self._get_tick_count = None
+            self.logger.warning("win32api not available, system idle detection is disabled")
 
     def start(self, task_name=""):
         """Start the timer with an optional task name."""
@@ -51,10 +73,10 @@ class TimeTracker:
             self.task_name = task_name
 
         if self.state == TimerState.STOPPED:
-            self.start_time = time.time()
+            self.start_time = _monotonic()
             self.elapsed_time = 0  # Reset elapsed time for a new session
             self.state = TimerState.RUNNING
-            self.logger.info(f"Timer started for task: '{self.task_name}'")
+            self.logger.info("Timer started for task: '%s'", self.task_name)
 
             # Call state change callback if exists
             if self.on_state_change:
@@ -62,7 +84,7 @@ class TimeTracker:
 
             return True
         else:
-            self.logger.warning(f"Cannot start timer: Timer already in state {self.state}")
+            self.logger.warning("Cannot start timer: Timer already in state %s", self.state)
             return False
 
     def stop(self):
@@ -72,13 +94,13 @@ class TimeTracker:
 
             # Calculate final elapsed time (if running)
             if self.state == TimerState.RUNNING:
-                self.elapsed_time += (time.time() - self.start_time)
+                self.elapsed_time += (_monotonic() - self.start_time)
 
             self.state = TimerState.STOPPED
 
             # Get elapsed time in hours
             hours_elapsed = self.get_elapsed_time(in_hours=True)
-            self.logger.info(f"Timer stopped for task: '{self.task_name}'. Total time: {hours_elapsed:.2f} hours")
+            self.logger.info("Timer stopped for task: '%s'. Total time: %.2f hours", self.task_name, hours_elapsed)
 
             # Call state change callback if exists
             if self.on_state_change:
@@ -88,7 +110,7 @@ class TimeTracker:
             return hours_elapsed
 
         else:
-            self.logger.warning(f"Cannot stop timer: Timer already in state {self.state}")
+            self.logger.warning("Cannot stop timer: Timer already in state %s", self.state)
             return 0
 
     def pause(self, reason=PauseReason.USER):
@@ -103,7 +125,8 @@ class TimeTracker:
         """
         if self.state == TimerState.RUNNING:
             # Record the time of when paused is pressed
-            self.pause_time = time.time()
+            self.pause_time = _monotonic()
+            self.long_pause_alerted = False
 
             # Calculate elapsed time up to this pause and add to accumulated time
             self.elapsed_time += (self.pause_time - self.start_time)
@@ -117,7 +140,7 @@ class TimeTracker:
                 self.state = TimerState.PAUSED
 
             self.last_pause_reason = reason
-            self.logger.info(f"Timer paused for task: '{self.task_name}'. Reason: {reason.name}")
+            self.logger.info("Timer paused for task: '%s'. Reason: %s", self.task_name, reason.name)
 
             # Call callbacks
             if self.on_state_change:
@@ -128,25 +151,26 @@ class TimeTracker:
 
             return True
         else:
-            self.logger.warning(f"Cannot pause timer: Timer is in state {self.state}")
+            self.logger.warning("Cannot pause timer: Timer is in state %s", self.state)
             return False
 
     def resume(self):
         """Resume the timer from a paused or idle state."""
-        if self.state in [TimerState.PAUSED, TimerState.IDLE]:
+        if self.state in PAUSED_STATES:
             # Store the previous state for logging/calculations
             previous_state = self.state
 
             if previous_state == TimerState.IDLE and self.idle_start_time:
                 # Calculate idle duration and update total_idle_time
-                idle_duration = time.time() - self.idle_start_time
+                idle_duration = _monotonic() - self.idle_start_time
                 self.total_idle_time += idle_duration
-                self.logger.info(f"Resumed after {idle_duration:.1f} seconds of idle time")
+                self.logger.info("Resumed after %.1f seconds of idle time", idle_duration)
 
             # Reset the start time to now
-            self.start_time = time.time()
+            self.start_time = _monotonic()
             self.state = TimerState.RUNNING
-            self.logger.info(f"Timer resumed for task: '{self.task_name}' from {previous_state.name} state")
+            self.long_pause_alerted = False
+            self.logger.info("Timer resumed for task: '%s' from %s state", self.task_name, previous_state.name)
 
             # Call state change callback if exists
             if self.on_state_change:
@@ -154,25 +178,52 @@ class TimeTracker:
 
             return True
         else:
-            self.logger.warning(f"Cannot resume timer: Timer is in state {self.state}")
+            self.logger.warning("Cannot resume timer: Timer is in state %s", self.state)
             return False
 
+    def idle_seconds(self):
+        """
+        Get how long the system has been idle, once that should pause the timer.
+
+        Only reads state, so it is safe to call from a worker thread.
+
+        Returns:
+            float: Idle time in seconds if the timer is running with idle checks
+                enabled and the idle threshold is reached, otherwise 0
+        """
+        if self.disable_idle_check or self.state != TimerState.RUNNING:
+            return 0
+
+        idle_time = self._get_system_idle_time()
+        return idle_time if idle_time >= self.idle_threshold else 0
+
+    def pause_duration(self):
+        """
+        Get how long the timer has been paused, once that is worth an alert.
+
+        Only reads state, so it is safe to call from a worker thread.
+
+        Returns:
+            float: Pause duration in seconds if paused or idle for at least
+                paused_duration_alert, otherwise 0
+        """
+        if self.state not in PAUSED_STATES or not self.pause_time:
+            return 0
+
+        pause_duration = _monotonic() - self.pause_time
+        return pause_duration if pause_duration >= self.paused_duration_alert else 0
+
     def check_idle(self):
         """Check if system is idle and handle appropriately."""
-        if hasattr(self, 'disable_idle_check') and self.disable_idle_check:
-            return False
-
-        if self.state == TimerState.RUNNING:
-            # Get system idle time in seconds
-            idle_time = self._get_system_idle_time()
+        idle_time = self.idle_seconds()
 
-            # If idle time exceeds threshold, pause the timer
-            if idle_time >= self.idle_threshold:
-                self.logger.info(f"System idle detected: {idle_time:.1f} seconds")
-                # Auto-pause due to idle
-                self.pause(reason=PauseReason.IDLE)
+        # If idle time exceeds threshold, pause the timer
+        if idle_time:
+            self.logger.info("System idle detected: %.1f seconds", idle_time)
+            # Auto-pause due to idle
+            self.pause(reason=PauseReason.IDLE)
 
-                return True
+            return True
 
         return False
 
@@ -183,24 +234,38 @@ class TimeTracker:
         Returns:
             bool: True if the pause duration exceeds the alert threshold, False otherwise
         """
-        if self.state in [TimerState.PAUSED, TimerState.IDLE] and self.pause_time:
-            # Calculate how long the timer has been paused
-            current_time = time.time()
-            pause_duration = current_time - self.pause_time
+        pause_duration = self.pause_duration()
 
-            # Check if pause duration exceeds threshold
-            if pause_duration >= self.paused_duration_alert:
-                # Format pause duration in minutes for logging
-                minutes = pause_duration / 60
-                self.logger.warning(f"Timer paused for {minutes:.1f} minutes")
+        # Check if pause duration exceeds threshold
+        if pause_duration:
+            self.alert_long_pause(pause_duration)
+            return True
 
-                # Call the long pause callback if it exists
-                if self.on_long_pause:
-                    self.on_long_pause(pause_duration)
+        return False
 
-                return True
+    def alert_long_pause(self, pause_duration):
+        """
+        Raise the long-pause alert through on_long_pause, once per pause.
 
-        return False
+        Args:
+            pause_duration (float): How long the timer has been paused, in seconds
+
+        Returns:
+            bool: True if the alert was raised by this call, False if already raised
+        """
+        if self.long_pause_alerted:
+            return False
+        self.long_pause_alerted = True
+
+        # Format pause duration in minutes for logging
+        minutes = pause_duration / 60
+        self.logger.warning("Timer paused for %.1f minutes", minutes)
+
+        # Call the long pause callback if it exists
+        if self.on_long_pause:
+            self.on_long_pause(pause_duration)
+
+        return True
 
     def get_elapsed_time(self, in_hours=False):
         """
@@ -216,7 +281,7 @@ class TimeTracker:
 
         # If timer is currently running, add the time since last start
         if self.state == TimerState.RUNNING and self.start_time:
-            current_elapsed += (time.time() - self.start_time)
+            current_elapsed += (_monotonic() - self.start_time)
 
         # Convert to hours if requested
         if in_hours:
@@ -226,16 +291,17 @@ class TimeTracker:
 
     def _get_system_idle_time(self):
         """Get the system idle time in seconds using Win32 API."""
+        if self._get_last_input_info is None:
+            return 0
         try:
-            import win32api
             # GetLastInputInfo returns the number of milliseconds since system startup
             # of the last input event (keyboard/mouse)
-            last_input_info = win32api.GetLastInputInfo()
+            last_input_info = self._get_last_input_info()
             # GetTickCount returns milliseconds since system startup
-            tick_count = win32api.GetTickCount()
+            tick_count = self._get_tick_count()
             # Calculate idle time in milliseconds, then convert to seconds
             idle_time = (tick_count - last_input_info) / 1000.0
             return idle_time
         except Exception as e:
-            self.logger.error(f"Error detecting system idle time: {e}")
+            self.logger.error("Error detecting system idle time: %s", e)
             return 0
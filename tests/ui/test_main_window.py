@@ -0,0 +1,190 @@
+import os
+import sys
+import threading
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+
+from src.ui.main_window import MainWindow
+from src.utils.time_tracker import PauseReason, TimerState
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+app.setQuitOnLastWindowClosed(False)
+
+
+def pump(ms=50):
+    """Run the event loop for the given number of milliseconds."""
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def open_window():
+    """Create a main window and wait for its services to start."""
+    window = MainWindow()
+    for _ in range(100):
+        if window.ui_service is not None:
+            break
+        pump()
+    assert window.ui_service is not None, "services did not start"
+    return window
+
+
+def close_window(window):
+    """Stop the window's worker threads so the test can exit cleanly."""
+    if window.idle_monitor is not None:
+        window.idle_monitor.stop()
+    window._wait_for_sync()
+    window._startup_thread.wait()
+    window.hide()
+
+
+def test_tray_waits_for_services():
+    window = MainWindow()
+    try:
+        # The window is up before the services, the tray follows once they are ready
+        assert window.ui_service is None
+        assert window.system_tray is None
+        assert not window.start_button.isEnabled()
+
+        for _ in range(100):
+            if window.ui_service is not None:
+                break
+            pump()
+        assert window.system_tray is not None
+        assert window.notifications._tray is window.system_tray
+        assert window.start_button.isEnabled()
+    finally:
+        close_window(window)
+
+
+def test_update_timer_follows_state():
+    window = open_window()
+    tracker = window.ui_service.time_tracker
+    try:
+        assert not window.update_timer.isActive()
+
+        assert window.start_task("timer states", None, [], True)
+        assert window.update_timer.isActive()
+        assert window.update_timer.interval() == 1000
+
+        tracker.pause()
+        assert window.update_timer.interval() == 5000
+        tracker.resume()
+        tracker.pause(PauseReason.IDLE)
+        assert window.update_timer.interval() == 5000
+        tracker.resume()
+        assert window.update_timer.interval() == 1000
+
+        tracker.stop()
+        assert not window.update_timer.isActive()
+    finally:
+        close_window(window)
+
+
+def test_stop_resets_timer_label():
+    window = open_window()
+    tracker = window.ui_service.time_tracker
+    try:
+        assert window.start_task("label reset", None, [], True)
+        pump(1100)
+        window.update_display()
+        assert window.timer_label.text() != "00:00:00"
+
+        tracker.stop()
+        assert tracker.state == TimerState.STOPPED
+        assert window.timer_label.text() == "00:00:00"
+
+        # The next task starts counting from zero again
+        assert window.start_task("label reset", None, [], True)
+        assert window.timer_label.text() == "00:00:00"
+        tracker.stop()
+    finally:
+        close_window(window)
+
+
+def wait_for_sync(window):
+    """Run the event loop until the window's sync thread has finished."""
+    for _ in range(100):
+        if not window._sync_thread.isRunning():
+            break
+        pump()
+    pump()
+    assert not window._sync_thread.isRunning(), "sync did not finish"
+
+
+def test_one_sync_at_a_time():
+    window = open_window()
+    release = threading.Event()
+    syncs = []
+    results = []
+
+    def slow_sync():
+        syncs.append(QtCore.QThread.currentThread())
+        release.wait(5)
+        return True
+
+    window.ui_service.sync_to_sheets = slow_sync
+    window._show_sync_result = lambda icon, title, text: results.append(title)
+    try:
+        thread = window._sync_thread
+        window.sync_to_sheets()
+        pump()
+
+        # A second request while the first is running is ignored
+        window.sync_to_sheets()
+        release.set()
+        wait_for_sync(window)
+        assert results == ["Sync Complete"]
+        assert len(syncs) == 1 and syncs[0] is thread
+
+        # The same thread runs the next sync
+        window.sync_to_sheets()
+        wait_for_sync(window)
+        assert results == ["Sync Complete", "Sync Complete"]
+        assert syncs[1] is thread and window._sync_thread is thread
+    finally:
+        release.set()
+        close_window(window)
+
+
+def test_sync_refreshes_tray_count():
+    window = open_window()
+    tray = window.system_tray
+    pending = [4]
+
+    def sync():
+        pending[0] = 0
+        return True
+
+    tray._get_unsynced = lambda: pending[0]
+    window.ui_service.sync_to_sheets = sync
+    window._show_sync_result = lambda icon, title, text: None
+    try:
+        tray.invalidate_unsynced_count()
+        tray.update_actions(TimerState.STOPPED)
+        pump(100)
+        assert "(4 tasks pending sync)" in tray.toolTip()
+
+        # The synced tasks drop out of the tooltip without waiting for the cache to expire
+        window.sync_to_sheets()
+        wait_for_sync(window)
+        pump(100)
+        assert "pending sync" not in tray.toolTip()
+    finally:
+        close_window(window)
+
+
+def main():
+    test_tray_waits_for_services()
+    test_update_timer_follows_state()
+    test_stop_resets_timer_label()
+    test_one_sync_at_a_time()
+    test_sync_refreshes_tray_count()
+    print("Main window tests passed")
+
+
+if __name__ == "__main__":
+    main()
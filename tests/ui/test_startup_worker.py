@@ -0,0 +1,91 @@
+import os
+import sys
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+
+from src.ui import startup_worker
+from src.ui.startup_worker import StartupWorker
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class FakeUIService:
+    """UI service stand-in that records the thread it was created on."""
+
+    fail = False
+
+    def __init__(self):
+        if self.fail:
+            raise RuntimeError("database locked")
+        self.thread = QtCore.QThread.currentThread()
+
+    def get_unsynced_tasks_count(self):
+        return 2
+
+
+def run_worker():
+    """Run a startup worker on its own thread and return what it reported."""
+    thread = QtCore.QThread()
+    worker = StartupWorker()
+    worker.moveToThread(thread)
+    ready = []
+    failed = []
+
+    loop = QtCore.QEventLoop()
+    thread.started.connect(worker.run)
+    worker.ready.connect(lambda service, count: ready.append((service, count)))
+    worker.failed.connect(failed.append)
+    worker.ready.connect(thread.quit)
+    worker.failed.connect(thread.quit)
+    thread.finished.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    thread.start()
+    loop.exec_()
+    thread.wait()
+    return ready, failed, thread
+
+
+def _with_fake_service(test):
+    def wrapper():
+        original = startup_worker.UIService
+        startup_worker.UIService = FakeUIService
+        try:
+            test()
+        finally:
+            startup_worker.UIService = original
+            FakeUIService.fail = False
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@_with_fake_service
+def test_services_are_created_off_the_gui_thread():
+    ready, failed, thread = run_worker()
+    assert not failed
+    assert len(ready) == 1
+    service, count = ready[0]
+    assert count == 2
+    assert service.thread is thread
+    assert service.thread is not app.thread()
+
+
+@_with_fake_service
+def test_startup_failure_is_reported():
+    FakeUIService.fail = True
+    ready, failed, _ = run_worker()
+    assert ready == []
+    assert failed == ["database locked"]
+
+
+def main():
+    test_services_are_created_off_the_gui_thread()
+    test_startup_failure_is_reported()
+    print("Startup worker tests passed")
+
+
+if __name__ == "__main__":
+    main()
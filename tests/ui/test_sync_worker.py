@@ -0,0 +1,72 @@
+import os
+import sys
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+
+from src.ui.sync_worker import SyncWorker
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class FakeUIService:
+    """UI service stand-in that records the thread the sync runs on."""
+
+    def __init__(self, result=True, error=None):
+        self.result = result
+        self.error = error
+        self.thread = None
+
+    def sync_to_sheets(self):
+        self.thread = QtCore.QThread.currentThread()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def run_worker(ui_service):
+    """Run a sync worker on its own thread and return what it reported."""
+    thread = QtCore.QThread()
+    worker = SyncWorker(ui_service)
+    worker.moveToThread(thread)
+    results = []
+
+    loop = QtCore.QEventLoop()
+    thread.started.connect(worker.run)
+    worker.finished.connect(lambda success, error: results.append((success, error)))
+    worker.finished.connect(thread.quit)
+    thread.finished.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    thread.start()
+    loop.exec_()
+    thread.wait()
+    return results, thread
+
+
+def test_sync_runs_off_the_gui_thread():
+    service = FakeUIService()
+    results, thread = run_worker(service)
+    assert results == [(True, "")]
+    assert service.thread is thread
+    assert service.thread is not app.thread()
+
+
+def test_sync_failure_is_reported():
+    results, _ = run_worker(FakeUIService(result=False))
+    assert results == [(False, "")]
+
+    results, _ = run_worker(FakeUIService(error=RuntimeError("offline")))
+    assert results == [(False, "offline")]
+
+
+def main():
+    test_sync_runs_off_the_gui_thread()
+    test_sync_failure_is_reported()
+    print("Sync worker tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+
+from src.ui.system_tray import SystemTrayIcon
+from src.utils.time_tracker import TimerState
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def pump(ms=100):
+    """Run the event loop for the given number of milliseconds."""
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+class FakeUIService:
+    """UI service stand-in that counts unsynced count lookups."""
+
+    def __init__(self, unsynced=3):
+        self.unsynced = unsynced
+        self.lookups = 0
+
+    def get_current_task_name(self):
+        return "Task"
+
+    def get_unsynced_tasks_count(self):
+        self.lookups += 1
+        return self.unsynced
+
+
+def make_tray(ui_service):
+    """Create a tray icon set up for a window using the given service."""
+    window = QtWidgets.QWidget()
+    window.ui_service = ui_service
+    tray = SystemTrayIcon(window)
+    noop = lambda: None
+    tray.setup(noop, noop, noop, noop, noop, noop, noop)
+    pump()
+    return window, tray
+
+
+def test_unsynced_count_is_reused():
+    service = FakeUIService()
+    window, tray = make_tray(service)
+    lookups = service.lookups
+
+    assert tray._unsynced_count() == 3
+    assert tray._unsynced_count() == 3
+    assert service.lookups == lookups
+
+    # An expired lookup is repeated
+    tray._unsynced_cache = (time.monotonic() - tray.UNSYNCED_COUNT_TTL, 3)
+    assert tray._unsynced_count() == 3
+    assert service.lookups == lookups + 1
+    tray.hide()
+
+
+def test_invalidate_unsynced_count():
+    service = FakeUIService()
+    window, tray = make_tray(service)
+    assert "(3 tasks pending sync)" in tray.toolTip()
+
+    # A sync cleared the pending tasks, the next update must see it at once
+    service.unsynced = 0
+    tray.invalidate_unsynced_count()
+    tray.update_actions(TimerState.STOPPED)
+    pump()
+    assert "pending sync" not in tray.toolTip()
+    tray.hide()
+
+
+def test_stopping_refreshes_unsynced_count():
+    service = FakeUIService(unsynced=0)
+    window, tray = make_tray(service)
+    tray.update_actions(TimerState.RUNNING)
+    pump()
+
+    # Stopping saves a task, the cached count from before is stale
+    service.unsynced = 1
+    tray.update_actions(TimerState.STOPPED)
+    pump()
+    assert "(1 tasks pending sync)" in tray.toolTip()
+    tray.hide()
+
+
+def main():
+    test_unsynced_count_is_reused()
+    test_invalidate_unsynced_count()
+    test_stopping_refreshes_unsynced_count()
+    print("System tray tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+
+from src.ui.task_dialog import TaskDialog
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def test_selected_categories_follow_checkboxes():
+    dialog = TaskDialog()
+    assert dialog._selected_categories == set()
+
+    # Checked in reverse, reported in listed order
+    dialog.category_checkboxes["School"].setChecked(True)
+    dialog.category_checkboxes["Chill"].setChecked(True)
+    assert dialog._selected_categories == {"Chill", "School"}
+    assert dialog.get_task_info()[2] == ["Chill", "School"]
+
+    dialog.category_checkboxes["Chill"].setChecked(False)
+    assert dialog._selected_categories == {"School"}
+
+
+def test_reset_clears_inputs():
+    dialog = TaskDialog()
+    dialog.task_name_input.setText("Task")
+    dialog.description_input.setPlainText("Details")
+    dialog.category_checkboxes["Gaming"].setChecked(True)
+    dialog.disable_idle_checkbox.setChecked(True)
+
+    dialog.reset()
+
+    assert dialog._selected_categories == set()
+    assert dialog.get_task_info() == ("", "", [], False)
+    assert dialog.button_box.button(QtWidgets.QDialogButtonBox.Ok).isEnabled()
+
+
+def main():
+    test_selected_categories_follow_checkboxes()
+    test_reset_clears_inputs()
+    print("Task dialog tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from src.utils.logger import AppLogger, get_logger
+
+
+def test_get_logger_is_shared():
+    logger = get_logger()
+    assert isinstance(logger, AppLogger)
+    assert get_logger() is logger
+
+    # The directory only applies on first use, later calls get the same logger
+    assert get_logger(log_dir="unused") is logger
+
+
+def main():
+    test_get_logger_is_shared()
+    print("Logger tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import os
+import sys
+import threading
+
+# Run without a display when no platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+
+from src.utils import notification_utils
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def test_winrt_toasts_need_registered_app_id():
+    shown = []
+    saved = notification_utils._show_winrt_toast, notification_utils._app_id_registered
+    notification_utils._show_winrt_toast = lambda title, message: shown.append((title, message))
+    try:
+        # Without a registered ID Windows would drop the toast, use the older notifier
+        notification_utils._app_id_registered = False
+        notification_utils._notify_windows("Title", "Message")
+        assert shown == []
+
+        notification_utils._app_id_registered = True
+        assert notification_utils._notify_windows("Title", "Message")
+        assert shown == [("Title", "Message")]
+    finally:
+        notification_utils._show_winrt_toast, notification_utils._app_id_registered = saved
+
+
+def test_register_app_id_only_on_windows():
+    if sys.platform != "win32":
+        assert not notification_utils.register_app_id()
+        assert not notification_utils._app_id_registered
+
+
+class _Recorder:
+    """Platform notifier stand-in that records what it was asked to show."""
+
+    def __init__(self):
+        self.shown = []
+        self.event = threading.Event()
+
+    def __call__(self, title, message):
+        self.shown.append((title, message))
+        self.event.set()
+        return True
+
+
+def _without_tray(test):
+    def wrapper():
+        recorder = _Recorder()
+        saved = (notification_utils._NOTIFIER, notification_utils._manager,
+                 QtWidgets.QSystemTrayIcon.isSystemTrayAvailable)
+        notification_utils._NOTIFIER = recorder
+        QtWidgets.QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: False)
+        try:
+            test(recorder)
+        finally:
+            (notification_utils._NOTIFIER, notification_utils._manager,
+             QtWidgets.QSystemTrayIcon.isSystemTrayAvailable) = saved
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@_without_tray
+def test_manager_uses_platform_without_tray(recorder):
+    manager = notification_utils.NotificationManager()
+    assert manager.show("Idle Detected", "Timer paused")
+    assert recorder.event.wait(2)
+    assert recorder.shown == [("Idle Detected", "Timer paused")]
+
+
+@_without_tray
+def test_platform_notifications_are_merged(recorder):
+    notification_utils.show_platform_notification("Sync Complete", "1 task")
+    notification_utils.show_platform_notification("Sync Error", "Timed out")
+    assert recorder.event.wait(2)
+    assert recorder.shown == [(notification_utils._APP_NAME, "Sync Complete: 1 task\nSync Error: Timed out")]
+
+
+@_without_tray
+def test_tray_fallback_without_tray(recorder):
+    # A failed platform method must not be sent back to the platform queue
+    assert not notification_utils._notify_tray("Title", "Message")
+    assert recorder.shown == []
+
+
+def main():
+    test_winrt_toasts_need_registered_app_id()
+    test_register_app_id_only_on_windows()
+    test_manager_uses_platform_without_tray()
+    test_platform_notifications_are_merged()
+    test_tray_fallback_without_tray()
+    print("Notification tests passed")
+
+
+if __name__ == "__main__":
+    main()
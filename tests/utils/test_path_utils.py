@@ -0,0 +1,79 @@
+import importlib
+import os
+import sys
+import tempfile
+
+from src.utils import path_utils
+
+
+def test_ensure_dir_creates_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        target = os.path.join(tmp, 'data')
+
+        path_utils._ensure_dir(target)
+        assert os.path.isdir(target)
+        assert target in path_utils._ENSURED
+
+        # A cached path is not checked again, so a removed directory stays removed
+        os.rmdir(target)
+        path_utils._ensure_dir(target)
+        assert not os.path.isdir(target)
+
+        path_utils._ENSURED.discard(target)
+
+
+def test_project_root_is_cached():
+    root = path_utils.get_project_root()
+    assert path_utils._PROJECT_ROOT == root
+    assert path_utils.get_project_root() is root
+
+
+def test_find_project_root_follows_frozen():
+    had_frozen = hasattr(sys, 'frozen')
+    try:
+        sys.frozen = True
+        frozen_module = importlib.reload(path_utils)
+        assert frozen_module._find_project_root is frozen_module._packaged_project_root
+
+        del sys.frozen
+        dev_module = importlib.reload(path_utils)
+        assert dev_module._find_project_root is dev_module._dev_project_root
+    finally:
+        if had_frozen:
+            sys.frozen = True
+        elif hasattr(sys, 'frozen'):
+            del sys.frozen
+        importlib.reload(path_utils)
+
+
+def test_debug_print_flushes_on_request():
+    saved = path_utils._DEBUG_DIR, path_utils._debug_fh
+    with tempfile.TemporaryDirectory() as tmp:
+        path_utils._DEBUG_DIR = tmp
+        path_utils._debug_fh = None
+        log_path = os.path.join(tmp, "debug.log")
+        try:
+            # Ordinary messages stay buffered until the flush interval
+            path_utils.debug_print("buffered")
+            with open(log_path) as f:
+                assert f.read() == ""
+
+            path_utils.debug_print("ERROR: flushed", flush=True)
+            with open(log_path) as f:
+                lines = f.read().splitlines()
+            assert [line.split("] ", 1)[1] for line in lines] == ["buffered", "ERROR: flushed"]
+        finally:
+            path_utils._debug_fh.close()
+            path_utils._DEBUG_DIR, path_utils._debug_fh = saved
+
+
+def main():
+    test_ensure_dir_creates_once()
+    test_project_root_is_cached()
+    test_find_project_root_follows_frozen()
+    test_debug_print_flushes_on_request()
+    print("Path utils tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import time
+
+from src.utils import time_tracker
+from src.utils.time_tracker import PAUSED_STATES, PauseReason, TimerState, TimeTracker
+
+
+class FakeClock:
+    """Monotonic clock stand-in that only moves when told to."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def _with_fake_clock(test):
+    def wrapper():
+        original = time_tracker._monotonic
+        time_tracker._monotonic = clock = FakeClock()
+        try:
+            test(clock)
+        finally:
+            time_tracker._monotonic = original
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+def test_paused_states():
+    assert TimerState.PAUSED in PAUSED_STATES
+    assert TimerState.IDLE in PAUSED_STATES
+    assert TimerState.RUNNING not in PAUSED_STATES
+    assert TimerState.STOPPED not in PAUSED_STATES
+
+
+@_with_fake_clock
+def test_elapsed_time_uses_monotonic_clock(clock):
+    tracker = TimeTracker()
+    tracker.start("test")
+    clock.advance(30)
+
+    # Wall clock jumps must not change the measured time
+    original_time = time.time
+    time.time = lambda: original_time() + 3600
+    try:
+        assert tracker.get_elapsed_time() == 30
+    finally:
+        time.time = original_time
+
+    tracker.pause()
+    clock.advance(100)
+    assert tracker.get_elapsed_time() == 30
+
+    tracker.resume()
+    clock.advance(15)
+    assert tracker.get_elapsed_time() == 45
+
+
+@_with_fake_clock
+def test_resume_from_either_paused_state(clock):
+    tracker = TimeTracker()
+    tracker.start("test")
+
+    for reason, state in ((PauseReason.USER, TimerState.PAUSED), (PauseReason.IDLE, TimerState.IDLE)):
+        assert tracker.pause(reason)
+        assert tracker.state == state
+        clock.advance(20)
+        assert tracker.resume()
+        assert tracker.state == TimerState.RUNNING
+
+    assert tracker.total_idle_time == 20
+
+
+@_with_fake_clock
+def test_pause_duration_threshold(clock):
+    tracker = TimeTracker(paused_duration_alert=600)
+    assert tracker.pause_duration() == 0
+
+    tracker.start("test")
+    tracker.pause()
+    clock.advance(599)
+    assert tracker.pause_duration() == 0
+    clock.advance(1)
+    assert tracker.pause_duration() == 600
+
+    tracker.resume()
+    assert tracker.pause_duration() == 0
+
+
+def test_idle_seconds_threshold():
+    tracker = TimeTracker(idle_threshold=300)
+    tracker._get_system_idle_time = lambda: 300
+    assert tracker.idle_seconds() == 0
+
+    tracker.start("test")
+    assert tracker.idle_seconds() == 300
+
+    tracker._get_system_idle_time = lambda: 299
+    assert tracker.idle_seconds() == 0
+
+    # Tasks can opt out of idle detection
+    tracker._get_system_idle_time = lambda: 300
+    tracker.disable_idle_check = True
+    assert tracker.idle_seconds() == 0
+
+
+def test_long_pause_alerts_once_per_pause():
+    tracker = TimeTracker()
+    alerts = []
+    tracker.on_long_pause = alerts.append
+    tracker.start("test")
+
+    tracker.pause()
+    assert tracker.alert_long_pause(600)
+    assert not tracker.alert_long_pause(605)
+    assert alerts == [600]
+
+    # The next pause can alert again
+    tracker.resume()
+    tracker.pause()
+    assert tracker.alert_long_pause(610)
+    assert alerts == [600, 610]
+
+
+def main():
+    test_paused_states()
+    test_elapsed_time_uses_monotonic_clock()
+    test_resume_from_either_paused_state()
+    test_pause_duration_threshold()
+    test_idle_seconds_threshold()
+    test_long_pause_alerts_once_per_pause()
+    print("Time tracker tests passed")
+
+
+if __name__ == "__main__":
+    main()